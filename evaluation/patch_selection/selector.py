@@ -34,6 +34,12 @@ def main():
         "--max_turn", type=int, default=50, help="Max turn times of Selector Agent"
     )
     _ = parser.add_argument("--majority_voting", action=argparse.BooleanOptionalAction)
+    _ = parser.add_argument(
+        "--max_parallel_votes",
+        type=int,
+        default=1,
+        help="Max number of majority votes (each in its own container) run at once per group",
+    )
     _ = parser.add_argument(
         "--config_file", type=str, default="config.yaml", help="Path to config file"
     )
@@ -43,11 +49,8 @@ def main():
     args.output_path = os.path.join(args.result_path, "output")
     args.patches_path = os.path.join(args.result_path, "patch")
     args.statistics_path = os.path.join(args.result_path, "statistics")
-    [
-        os.makedirs(_)
-        for _ in [args.log_path, args.patches_path, args.output_path, args.statistics_path]
-        if not os.path.exists(_)
-    ]
+    for path in (args.log_path, args.patches_path, args.output_path, args.statistics_path):
+        Path(path).mkdir(parents=True, exist_ok=True)
 
     with open(args.instances_path, "r") as file:
         instance_list = json.load(file)
@@ -61,12 +64,11 @@ def main():
 
     candidate_dic = {}
     with open(args.candidate_path, "r") as file:
-        for line in file.readlines():
-            candidate = json.loads(line.strip())
-            if "regressions" not in candidate:
-                candidate["regressions"] = []
-                for _ in range(len(candidate["patches"])):
-                    candidate["regressions"].append([])
+        for line in file:
+            if not line.strip():
+                continue
+            candidate = json.loads(line)
+            candidate.setdefault("regressions", [[] for _ in candidate["patches"]])
             candidate_dic[candidate["instance_id"]] = candidate
 
     tools_path = Path(__file__).parent / "trae_selector/tools"
@@ -92,6 +94,7 @@ def main():
         args.statistics_path,
         args.group_size,
         majority_voting=args.majority_voting,
+        max_parallel_votes=args.max_parallel_votes,
     )
 
     # evaluation.run_one("astropy__astropy-14369")
@@ -1,12 +1,21 @@
 import subprocess
 import time
+from typing import TextIO
 
 import docker
 import pexpect
 
 
 class Sandbox:
-    def __init__(self, namespace: str, name: str, tag: str, instance: dict, tools_path: str):
+    def __init__(
+        self,
+        namespace: str,
+        name: str,
+        tag: str,
+        instance: dict,
+        tools_path: str,
+        log_file: TextIO | None = None,
+    ):
         self.namespace = namespace
         self.name = name
         self.tag = tag
@@ -16,6 +25,7 @@ class Sandbox:
         self.container = None
         self.shell = None
         self.tools_path = tools_path
+        self.log_file = log_file
 
     def get_project_path(self):
         project_path = self.container.exec_run("pwd").output.decode().strip()
@@ -33,13 +43,13 @@ class Sandbox:
             privileged=True,
             volumes={host_path: {"bind": container_path, "mode": "rw"}},
         )
-        print(f"Container {self.container.short_id} started with image {image}")
+        print(f"Container {self.container.short_id} started with image {image}", file=self.log_file)
 
         cmd = f"chmod -R 777 {self.tools_path} && docker cp {self.tools_path} {self.container.name}:/home/swe-bench/"
         subprocess.run(cmd, check=True, shell=True)
 
         checkout_res = self.container.exec_run(f"git checkout {self.commit_id}")
-        print("checkout: ", checkout_res)
+        print("checkout: ", checkout_res, file=self.log_file)
 
     def start_shell(self):
         if self.container:
@@ -119,5 +129,5 @@ class Sandbox:
                 self.shell = None
             self.container.stop()
             self.container.remove()
-            print(f"Container {self.container.short_id} stopped and removed")
+            print(f"Container {self.container.short_id} stopped and removed", file=self.log_file)
             self.container = None
@@ -1,5 +1,7 @@
 import re
 import shlex
+from dataclasses import dataclass
+from typing import TextIO
 
 from trae_agent.tools import tools_registry
 from trae_agent.tools.base import Tool, ToolResult
@@ -11,13 +13,13 @@ from trae_agent.utils.trajectory_recorder import TrajectoryRecorder
 from .sandbox import Sandbox
 
 
+@dataclass(frozen=True, slots=True)
 class CandidatePatch:
-    def __init__(self, id, patch, cleaned_patch, is_success_regression, is_success_patch):
-        self.id = id
-        self.patch = patch
-        self.cleaned_patch = cleaned_patch
-        self.is_success_regression = is_success_regression
-        self.is_success_patch = is_success_patch
+    id: int
+    patch: str
+    cleaned_patch: str
+    is_success_regression: bool
+    is_success_patch: int
 
 
 def build_system_prompt(candidate_length: int) -> str:
@@ -58,9 +60,11 @@ Choose the patch that best resolves the issue with minimal risk of introducing n
     return init_prompt
 
 
-def parse_tool_response(answer: LLMResponse, finish_reason: str, sandbox_session):
+def parse_tool_response(
+    answer: LLMResponse, finish_reason: str, sandbox_session, log_file: TextIO | None = None
+):
     result: list[LLMMessage] = []
-    print("finish_reason:", finish_reason)
+    print("finish_reason:", finish_reason, file=log_file)
     if answer.tool_calls and len(answer.tool_calls) > 0:
         for tool_call in answer.tool_calls:
             tool_call_id = tool_call.call_id
@@ -104,7 +108,7 @@ def parse_tool_response(answer: LLMResponse, finish_reason: str, sandbox_session
                     cmd += f" --{key} {shlex.quote(tool_arguments[key])}"
 
             if not all_arguments_valid:
-                print("Tool Call Status: -1")
+                print("Tool Call Status: -1", file=log_file)
                 tool_message = LLMMessage(
                     role="user",
                     content="Failed call tool. One of the arguments is dict type, you need to check the definition the tool.",
@@ -119,7 +123,7 @@ def parse_tool_response(answer: LLMResponse, finish_reason: str, sandbox_session
                 continue
 
             cmd += " > /home/swe-bench/tools/log.out 2>&1"
-            print(repr(cmd))
+            print(repr(cmd), file=log_file)
             _ = sandbox_session.execute(cmd)
             sandbox_res = sandbox_session.execute("cat /home/swe-bench/tools/log.out")
             status = ""
@@ -133,7 +137,7 @@ def parse_tool_response(answer: LLMResponse, finish_reason: str, sandbox_session
             if status_line_index != -1:
                 sandbox_res_str_list.pop(status_line_index)
             res_content = "\n".join(sandbox_res_str_list)
-            print(status)
+            print(status, file=log_file)
             tool_message = LLMMessage(
                 role="user",
                 content=res_content,
@@ -161,8 +165,10 @@ class SelectorAgent:
         trajectory_file_name: str,
         candidate_list: list[CandidatePatch],
         max_turn: int = 50,
+        log_file: TextIO | None = None,
     ):
         self.llm_config = llm_config
+        self.log_file = log_file
         self.max_turn = max_turn
         self.sandbox = sandbox
         self.sandbox_session = self.sandbox.get_session()
@@ -188,8 +194,8 @@ class SelectorAgent:
         self.initial_messages.append(user_message)
 
     def run(self):
-        print(f"max_turn: {self.max_turn}")
-        print(f"### User Prompt:\n{self.initial_messages[1].content}\n")
+        print(f"max_turn: {self.max_turn}", file=self.log_file)
+        print(f"### User Prompt:\n{self.initial_messages[1].content}\n", file=self.log_file)
 
         turn = 0
         final_id, final_patch = self.candidate_list[0].id, self.candidate_list[0].patch
@@ -205,7 +211,7 @@ class SelectorAgent:
                 self.tools,
             )
             answer_content = llm_response.content
-            print(f"\n### Selector's Answer({turn})\n", answer_content)
+            print(f"\n### Selector's Answer({turn})\n", answer_content, file=self.log_file)
             messages: list[LLMMessage] = []
             match = re.search(
                 r"(?:###\s*)?Status:\s*(success|succeed|successfully|successful)\s*\n\s*(?:###\s*)?Result:",
@@ -213,13 +219,13 @@ class SelectorAgent:
             )
 
             if match:
-                print("Match-1:", match.group(1).strip())
+                print("Match-1:", match.group(1).strip(), file=self.log_file)
                 match = re.search(
                     r"(?:###\s*)?Result:\s*(.+?)\s*(?:###\s*)?Analysis:", answer_content
                 )
                 if match:
                     result = match.group(1).strip().split("Patch-")[-1]
-                    print("Match-2:", result)
+                    print("Match-2:", result, file=self.log_file)
                     if result in [str(_ + 1) for _ in range(len(self.candidate_list))]:
                         final_id = self.candidate_list[int(result) - 1].id
                         final_patch = self.candidate_list[int(result) - 1].patch
@@ -229,12 +235,15 @@ class SelectorAgent:
                     break
             else:
                 messages += parse_tool_response(
-                    llm_response, llm_response.finish_reason or "", self.sandbox_session
+                    llm_response,
+                    llm_response.finish_reason or "",
+                    self.sandbox_session,
+                    self.log_file,
                 )
                 if messages[-1].content and " seconds. Partial output:" in messages[-1].content:
                     self.sandbox_session = self.sandbox.get_session()
 
-            print(f"\n### System Response({turn})\n", messages)
+            print(f"\n### System Response({turn})\n", messages, file=self.log_file)
         self.trajectory_recorder.finalize_recording(True, final_patch)
         self.sandbox_session.execute("git reset --hard HEAD")
         self.sandbox_session.close()
@@ -1,10 +1,12 @@
+import logging
 import os
 import sys
 import traceback
 from collections import Counter
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from typing import TextIO
 
 from tqdm import tqdm
 
@@ -30,21 +32,20 @@ def run_instance(
     log_path,
     patches_path,
     majority_voting=True,
+    max_parallel_votes=1,
 ):
     # candidate_log is a list of num_candidate candidate patches
-    # divide candidate_log into groups of group_size
-    groups = []
-    for i in range(0, num_candidate, group_size):
-        this_group = {
+    # divide candidate_log into groups of group_size, slicing each group only when it is run
+    group_starts = range(0, num_candidate, group_size)
+    for group_id, start in enumerate(group_starts):
+        end = start + group_size
+        group = {
             "instance_id": candidate_log["instance_id"],
             "issue": candidate_log["issue"],
-            "patches": candidate_log["patches"][i : i + group_size],
-            "regressions": candidate_log["regressions"][i : i + group_size],
-            "success_id": candidate_log["success_id"][i : i + group_size],
+            "patches": candidate_log["patches"][start:end],
+            "regressions": candidate_log["regressions"][start:end],
+            "success_id": candidate_log["success_id"][start:end],
         }
-        groups.append(this_group)
-
-    for group_id, group in enumerate(groups):
         run_instance_by_group(
             instance=instance,
             candidate_log=group,
@@ -58,9 +59,91 @@ def run_instance(
             log_path=log_path,
             patches_path=patches_path,
             group_id=group_id,
-            num_groups=len(groups),
+            num_groups=len(group_starts),
             majority_voting=majority_voting,
+            max_parallel_votes=max_parallel_votes,
+        )
+
+
+def prepare_candidates(candidate_log, log_file: TextIO) -> list[CandidatePatch]:
+    """Filter a group's candidates by regression tests and drop duplicate patches."""
+    patches = candidate_log["patches"]
+    regressions = candidate_log["regressions"]
+    candidate_ids = [idx for idx in range(len(patches)) if patches[idx].strip() != ""]
+
+    # regression testing: keep only the candidates passing regression tests, if any do
+    regression_ids = [idx for idx in candidate_ids if len(regressions[idx]) == 0]
+    if len(regression_ids):
+        candidate_ids = regression_ids
+    print("regression testing done", file=log_file)
+
+    # patch deduplication; only the remaining candidates need cleaning
+    candidate_list, cleaned_candidate_set = [], set()
+    for idx in candidate_ids:
+        cleaned_patch = clean_patch(patches[idx])
+        if cleaned_patch in cleaned_candidate_set:
+            continue
+        cleaned_candidate_set.add(cleaned_patch)
+        candidate_list.append(
+            CandidatePatch(
+                idx,
+                patches[idx],
+                cleaned_patch,
+                len(regressions[idx]) == 0,
+                candidate_log["success_id"][idx],
+            )
         )
+    print("patch deduplication done", file=log_file)
+    return candidate_list
+
+
+def run_selector_vote(
+    *,
+    instance,
+    namespace,
+    image_name,
+    tag,
+    tools_path,
+    llm_config,
+    trajectory_file_name,
+    candidate_list,
+    max_turn,
+    log_file,
+    sandbox=None,
+):
+    """Run one majority-voting selector agent.
+
+    The agent runs in the given sandbox, which it leaves reset to HEAD. Without one, it gets
+    a sandbox of its own that is stopped afterwards, so that votes can run in parallel.
+    """
+    if sandbox is not None:
+        return SelectorAgent(
+            llm_config=llm_config,
+            sandbox=sandbox,
+            project_path=sandbox.get_project_path(),
+            issue_description=instance["problem_statement"],
+            trajectory_file_name=trajectory_file_name,
+            candidate_list=candidate_list,
+            max_turn=max_turn,
+            log_file=log_file,
+        ).run()
+
+    sandbox = Sandbox(namespace, image_name, tag, instance, tools_path, log_file=log_file)
+    try:
+        sandbox.start_container()
+        select_agent = SelectorAgent(
+            llm_config=llm_config,
+            sandbox=sandbox,
+            project_path=sandbox.get_project_path(),
+            issue_description=instance["problem_statement"],
+            trajectory_file_name=trajectory_file_name,
+            candidate_list=candidate_list,
+            max_turn=max_turn,
+            log_file=log_file,
+        )
+        return select_agent.run()
+    finally:
+        sandbox.stop_container()
 
 
 def run_instance_by_group(
@@ -79,6 +162,7 @@ def run_instance_by_group(
     group_id,
     num_groups,
     majority_voting=True,
+    max_parallel_votes=1,
 ):
     print(f"[Group {group_id}/{num_groups}] processing: {instance['instance_id']}")
     sys.stdout.flush()
@@ -92,26 +176,18 @@ def run_instance_by_group(
         )
         sys.stdout.flush()
         sys.stderr.flush()
-        sys.stdout = sys.__stdout__
-        sys.stderr = sys.__stderr__
         return
 
     # check if the group is all failed or all success. If so, skip this group
-    all_failed = True
-    all_success = True
-    for success_id in candidate_log["success_id"]:
-        if success_id == 1:
-            all_failed = False
-        if success_id != 1:
-            all_success = False
+    num_success = candidate_log["success_id"].count(1)
+    all_failed = num_success == 0
+    all_success = num_success == len(candidate_log["success_id"])
     if all_failed or all_success:
         print(
             f"[Group ID {group_id} in {num_groups}] groups for instance {instance['instance_id']} {'all failed' if all_failed else 'all success'}. Skipping..."
         )
         sys.stdout.flush()
         sys.stderr.flush()
-        sys.stdout = sys.__stdout__
-        sys.stderr = sys.__stderr__
 
         save_patches(
             instance_id=instance["instance_id"],
@@ -146,120 +222,133 @@ def run_instance_by_group(
     log_dir_path = Path(output_path) / f"group_{group_id}"
     log_dir_path.mkdir(parents=True, exist_ok=True)
     log_file_path = log_dir_path / f"{instance['instance_id']}.log"
-    with open(log_file_path, "w") as log_file:
-        sys.stdout = log_file
-        sys.stderr = log_file
+    with open(log_file_path, "w", buffering=1) as log_file:
         namespace = "swebench"
         image_name = "sweb.eval.x86_64." + instance["instance_id"].replace("__", "_1776_")
         tag = "latest"
 
+        # trae_agent reports LLM retries and trajectory errors through logging; only one group
+        # runs in a process at a time, so its handler collects them into this group's log
+        log_handler = logging.StreamHandler(log_file)
+        trae_agent_logger = logging.getLogger("trae_agent")
+        trae_agent_logger.addHandler(log_handler)
         try:
+            candidate_list = None
             current_try = 0
             while current_try < max_retry:
-                print("current_try:", current_try)
-                sys.stdout.flush()
-                sys.stderr.flush()
-                print("time: ", datetime.now().strftime("%Y%m%d%H%M%S"))
-                sys.stdout.flush()
-                sys.stderr.flush()
+                print("current_try:", current_try, file=log_file)
+                print("time: ", datetime.now().strftime("%Y%m%d%H%M%S"), file=log_file)
                 current_try += 1
                 sandbox = None
                 try:
-                    candidate_list = []
-                    for idx in range(len(candidate_log["patches"])):
-                        if candidate_log["patches"][idx].strip() == "":
-                            continue
-                        cleaned_patch = clean_patch(candidate_log["patches"][idx])
-                        is_success_regression = len(candidate_log["regressions"][idx]) == 0
-                        candidate_list.append(
-                            CandidatePatch(
-                                idx,
-                                candidate_log["patches"][idx],
-                                cleaned_patch,
-                                is_success_regression,
-                                candidate_log["success_id"][idx],
-                            )
-                        )
-
-                    # regression testing
-                    candidate_list_regression = [
-                        candidate for candidate in candidate_list if candidate.is_success_regression
-                    ]
-                    if len(candidate_list_regression):
-                        candidate_list = candidate_list_regression
-                    print(f"[Retry No:{current_try}] regression testing done")
-                    sys.stdout.flush()
-                    sys.stderr.flush()
-
-                    # patch deduplication
-                    candidate_list_deduplication, cleaned_candidate_set = [], set()
-                    for candidate in candidate_list:
-                        if candidate.cleaned_patch not in cleaned_candidate_set:
-                            cleaned_candidate_set.add(candidate.cleaned_patch)
-                            candidate_list_deduplication.append(candidate)
-                    candidate_list = candidate_list_deduplication
-                    print(f"[Retry No:{current_try}] patch deduplication done")
-                    sys.stdout.flush()
-                    sys.stderr.flush()
-
-                    # sandbox & tools
-                    sandbox = Sandbox(namespace, image_name, tag, instance, tools_path)
-                    sandbox.start_container()
-                    project_path = sandbox.get_project_path()
-                    print(f"[Retry No:{current_try}] sandbox & tools done")
-                    sys.stdout.flush()
-                    sys.stderr.flush()
+                    # the candidates do not change between retries, so prepare them only
+                    # once; a failure here is logged and retried like any other
+                    if candidate_list is None:
+                        candidate_list = prepare_candidates(candidate_log, log_file)
 
                     # majority voting
                     if majority_voting:
                         final_id_list, final_patch_list = [], []
-                        for idx in range(num_candidate):
-                            select_agent = SelectorAgent(
-                                llm_config=llm_config,
-                                sandbox=sandbox,
-                                project_path=project_path,
-                                issue_description=instance["problem_statement"],
-                                trajectory_file_name=get_trajectory_filename(
-                                    instance["instance_id"], log_path, group_id, idx
-                                ),
-                                candidate_list=candidate_list,
-                                max_turn=max_turn,
-                            )
-
-                            final_id, final_patch = select_agent.run()
-                            final_id_list.append(final_id)
-                            final_patch_list.append(final_patch)
-                            if max(Counter(final_id_list).values()) > num_candidate / 2:
+                        vote_counter: Counter[int] = Counter()
+                        # A patch wins once it has more than half of num_candidate votes, so
+                        # launch just enough votes to possibly reach that and only top up
+                        # with more votes while no patch has a majority yet. Votes run one at
+                        # a time share a single sandbox for the retry; parallel votes each get
+                        # their own, at most max_parallel_votes at once per group.
+                        majority = num_candidate // 2 + 1
+                        vote_args = {
+                            "instance": instance,
+                            "namespace": namespace,
+                            "image_name": image_name,
+                            "tag": tag,
+                            "tools_path": tools_path,
+                            "llm_config": llm_config,
+                            "candidate_list": candidate_list,
+                            "max_turn": max_turn,
+                            "log_file": log_file,
+                        }
+                        while len(final_id_list) < num_candidate:
+                            top_count = max(vote_counter.values(), default=0)
+                            if top_count >= majority:
                                 break
-                        print(f"[Retry No:{current_try}] majority voting done")
-                        sys.stdout.flush()
-                        sys.stderr.flush()
+                            batch_size = min(
+                                majority - top_count,
+                                num_candidate - len(final_id_list),
+                                max(max_parallel_votes, 1),
+                            )
+                            first_idx = len(final_id_list)
+                            trajectory_file_names = [
+                                get_trajectory_filename(
+                                    instance["instance_id"],
+                                    log_path,
+                                    group_id,
+                                    idx,
+                                    log_file=log_file,
+                                )
+                                for idx in range(first_idx, first_idx + batch_size)
+                            ]
+                            if batch_size == 1:
+                                if sandbox is None:
+                                    sandbox = Sandbox(
+                                        namespace,
+                                        image_name,
+                                        tag,
+                                        instance,
+                                        tools_path,
+                                        log_file=log_file,
+                                    )
+                                    sandbox.start_container()
+                                votes = [
+                                    run_selector_vote(
+                                        **vote_args,
+                                        trajectory_file_name=trajectory_file_names[0],
+                                        sandbox=sandbox,
+                                    )
+                                ]
+                            else:
+                                with ThreadPoolExecutor(max_workers=batch_size) as ex:
+                                    futures = [
+                                        ex.submit(
+                                            run_selector_vote,
+                                            **vote_args,
+                                            trajectory_file_name=trajectory_file_name,
+                                        )
+                                        for trajectory_file_name in trajectory_file_names
+                                    ]
+                                    votes = [future.result() for future in futures]
+                            for final_id, final_patch in votes:
+                                final_id_list.append(final_id)
+                                final_patch_list.append(final_patch)
+                                vote_counter[final_id] += 1
+                        print(f"[Retry No:{current_try}] majority voting done", file=log_file)
 
-                        counter = Counter(final_id_list)
-                        max_count = max(counter.values())
-                        most_common_ids = [
-                            elem for elem, count in counter.items() if count == max_count
-                        ]
-                        result = {}
-                        for id_ in most_common_ids:
-                            indexes = [i for i, val in enumerate(final_id_list) if val == id_]
-                            result[id_] = indexes
-                        final_id = most_common_ids[0]
-                        final_patch = final_patch_list[result[final_id][0]]
-                        print(f"[Retry No:{current_try}] final_id_list: {final_id_list}")
-                        sys.stdout.flush()
-                        sys.stderr.flush()
+                        # ties go to the patch that was voted for first
+                        final_id = vote_counter.most_common(1)[0][0]
+                        final_patch = final_patch_list[final_id_list.index(final_id)]
+                        print(
+                            f"[Retry No:{current_try}] final_id_list: {final_id_list}",
+                            file=log_file,
+                        )
                     else:
+                        # sandbox & tools
+                        sandbox = Sandbox(
+                            namespace, image_name, tag, instance, tools_path, log_file=log_file
+                        )
+                        sandbox.start_container()
+                        project_path = sandbox.get_project_path()
+                        print(f"[Retry No:{current_try}] sandbox & tools done", file=log_file)
+
                         select_agent = SelectorAgent(
                             llm_config=llm_config,
                             sandbox=sandbox,
                             project_path=project_path,
                             issue_description=instance["problem_statement"],
                             trajectory_file_name=get_trajectory_filename(
-                                instance["instance_id"], log_path, group_id, 0
+                                instance["instance_id"], log_path, group_id, 0, log_file=log_file
                             ),
                             candidate_list=candidate_list,
                             max_turn=max_turn,
+                            log_file=log_file,
                         )
                         final_id, final_patch = select_agent.run()
                     save_patches(
@@ -267,6 +356,7 @@ def run_instance_by_group(
                         patches_path=patches_path,
                         patches=final_patch,
                         group_id=group_id,
+                        log_file=log_file,
                     )
 
                     is_success_patch = 0
@@ -280,20 +370,16 @@ def run_instance_by_group(
                         is_success=is_success_patch,
                         group_id=group_id,
                     )
-                    sandbox.stop_container()
+                    if sandbox is not None:
+                        sandbox.stop_container()
                     break
                 except Exception as e:
-                    print(f"Error occurred: {e}")
-                    sys.stdout.flush()
-                    sys.stderr.flush()
-                    print("Detailed Error:\n", traceback.format_exc())
-                    sys.stdout.flush()
-                    sys.stderr.flush()
+                    print(f"Error occurred: {e}", file=log_file)
+                    print("Detailed Error:\n", traceback.format_exc(), file=log_file)
                     if sandbox is not None:
                         sandbox.stop_container()
         finally:
-            sys.stdout = sys.__stdout__
-            sys.stderr = sys.__stderr__
+            trae_agent_logger.removeHandler(log_handler)
             print(f"         finished: {instance['instance_id']}")
 
 
@@ -313,6 +399,7 @@ class SelectorEvaluation:
         statistics_path: str,
         group_size: int,
         majority_voting: bool = True,
+        max_parallel_votes: int = 1,
     ):
         self.llm_config = llm_config
         self.num_candidate = num_candidate
@@ -327,12 +414,18 @@ class SelectorEvaluation:
         self.statistics_path = statistics_path
         self.group_size = group_size
         self.majority_voting = majority_voting
+        self.max_parallel_votes = max_parallel_votes
 
     def run_all(self, max_workers=None):
-        """Run all instances concurrently using ThreadPoolExecutor.
+        """Run all instances concurrently using ProcessPoolExecutor.
+
+        Each group's log file is passed explicitly to its selector agents and sandboxes,
+        so nothing redirects sys.stdout/sys.stderr. With majority voting, every
+        process can run up to max_parallel_votes sandbox containers at once, so up to
+        max_workers * max_parallel_votes containers may be running.
 
         Args:
-            max_workers: Maximum number of worker threads. If None, defaults to min(32, os.cpu_count() + 4)
+            max_workers: Maximum number of worker processes. If None, defaults to os.cpu_count()
         """
         with ProcessPoolExecutor(max_workers=max_workers) as ex:
             futures = {
@@ -351,6 +444,7 @@ class SelectorEvaluation:
                     log_path=self.log_path,
                     patches_path=self.patches_path,
                     majority_voting=self.majority_voting,
+                    max_parallel_votes=self.max_parallel_votes,
                 ): instance["instance_id"]
                 for instance in self.instance_list
             }
@@ -386,4 +480,5 @@ class SelectorEvaluation:
                     log_path=self.log_path,
                     patches_path=self.patches_path,
                     majority_voting=self.majority_voting,
+                    max_parallel_votes=self.max_parallel_votes,
                 )
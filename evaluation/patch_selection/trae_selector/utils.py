@@ -4,9 +4,19 @@ import os
 import re
 import tokenize
 from pathlib import Path
+from typing import TextIO
 
 from unidiff import PatchSet
 
+# directories already created by this process, so repeated saves skip the mkdir
+_created_dirs: set[Path] = set()
+
+
+def _ensure_dir(dir_path: Path):
+    if dir_path not in _created_dirs:
+        dir_path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(dir_path)
+
 
 def remove_comments_from_line(line: str) -> str:
     try:
@@ -74,32 +84,30 @@ def clean_patch(ori_patch_text):
     return new_patch_text
 
 
-def save_patches(instance_id, patches_path, patches, group_id=1):
-    trial_index = 1
-
+def save_patches(instance_id, patches_path, patches, group_id=1, log_file: TextIO | None = None):
     dir_path = Path(patches_path) / f"group_{group_id}"
-    dir_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(dir_path)
 
-    def get_unique_filename(patches_path, trial_index):
-        filename = f"{instance_id}_{trial_index}.patch"
-        while os.path.exists(dir_path / filename):
+    # claim the first free {instance_id}_{trial_index}.patch; mode "x" fails if the file exists
+    trial_index = 1
+    while True:
+        patch_file = dir_path / f"{instance_id}_{trial_index}.patch"
+        try:
+            with open(patch_file, "x") as file:
+                file.write(patches)
+            break
+        except FileExistsError:
             trial_index += 1
-            filename = f"{instance_id}_{trial_index}.patch"
-        return filename
-
-    patch_file = get_unique_filename(patches_path, trial_index)
 
-    clean_patch = patches
-    with open(dir_path / patch_file, "w") as file:
-        file.write(clean_patch)
+    print(f"Patches saved in {patch_file}", file=log_file)
 
-    print(f"Patches saved in {dir_path / patch_file}")
 
-
-def get_trajectory_filename(instance_id, traj_dir, group_id=1, voting_id=1):
+def get_trajectory_filename(
+    instance_id, traj_dir, group_id=1, voting_id=1, log_file: TextIO | None = None
+):
     dir_path = Path(traj_dir) / f"group_{group_id}"
-    dir_path.mkdir(parents=True, exist_ok=True)
-    print("dir_path", dir_path)
+    _ensure_dir(dir_path)
+    print("dir_path", dir_path, file=log_file)
 
     def get_unique_filename():
         trial_index = 1
@@ -123,21 +131,20 @@ def save_selection_success(
     is_all_failed=False,
 ):
     dir_path = Path(statistics_path) / f"group_{group_id}"
-    dir_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(dir_path)
     file_path = dir_path / f"{instance_id}.json"
 
     with open(file_path, "w") as statistics_file:
-        statistics_file.write(
-            json.dumps(
-                {
-                    "instance_id": instance_id,
-                    "patch_id": patch_id,
-                    "is_success": is_success,
-                    "is_all_success": is_all_success,
-                    "is_all_failed": is_all_failed,
-                },
-                indent=4,
-                sort_keys=True,
-                ensure_ascii=False,
-            )
+        json.dump(
+            {
+                "instance_id": instance_id,
+                "patch_id": patch_id,
+                "is_success": is_success,
+                "is_all_success": is_all_success,
+                "is_all_failed": is_all_failed,
+            },
+            statistics_file,
+            indent=4,
+            sort_keys=True,
+            ensure_ascii=False,
         )
@@ -1,3 +1,4 @@
+import os
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -10,11 +11,11 @@ class TestCli(unittest.TestCase):
     def setUp(self):
         self.runner = CliRunner()
 
-    @patch("trae_agent.cli.resolve_config_file", return_value="test_config.yaml")
-    @patch("trae_agent.cli.Agent")
-    @patch("trae_agent.cli.asyncio.run")
-    @patch("trae_agent.cli.Config.create")
-    @patch("trae_agent.cli.ConsoleFactory.create_console")
+    @patch("trae_agent.cli._run.resolve_config_file", return_value="test_config.yaml")
+    @patch("trae_agent.cli._run.Agent")
+    @patch("trae_agent.cli._run.asyncio.run")
+    @patch("trae_agent.cli._run.Config.create")
+    @patch("trae_agent.cli._run.ConsoleFactory.create_console")
     def test_run_with_long_prompt(
         self,
         mock_create_console,
@@ -46,11 +47,11 @@ class TestCli(unittest.TestCase):
         args, _ = mock_agent.run.call_args
         self.assertEqual(args[0], long_prompt)
 
-    @patch("trae_agent.cli.resolve_config_file", return_value="test_config.yaml")
-    @patch("trae_agent.cli.Agent")
-    @patch("trae_agent.cli.asyncio.run")
-    @patch("trae_agent.cli.Config.create")
-    @patch("trae_agent.cli.ConsoleFactory.create_console")
+    @patch("trae_agent.cli._run.resolve_config_file", return_value="test_config.yaml")
+    @patch("trae_agent.cli._run.Agent")
+    @patch("trae_agent.cli._run.asyncio.run")
+    @patch("trae_agent.cli._run.Config.create")
+    @patch("trae_agent.cli._run.ConsoleFactory.create_console")
     def test_run_with_file_argument(
         self,
         mock_create_console,
@@ -85,14 +86,23 @@ class TestCli(unittest.TestCase):
             args, _ = mock_agent.run.call_args
             self.assertEqual(args[0], "task from file")
 
-    @patch("trae_agent.cli.resolve_config_file", return_value="test_config.yaml")
+    @patch("trae_agent.cli._run.resolve_config_file", return_value="test_config.yaml")
     def test_run_with_nonexistent_file(self, mock_resolve_config_file):
         """Test for a clear error when --file points to a non-existent file."""
         result = self.runner.invoke(cli, ["run", "--file", "nonexistent.txt"])
         self.assertNotEqual(result.exit_code, 0)
         self.assertIn("Error: File not found: nonexistent.txt", result.output)
 
-    @patch("trae_agent.cli.resolve_config_file", return_value="test_config.yaml")
+    @patch("trae_agent.cli._run.resolve_config_file", return_value="test_config.yaml")
+    def test_run_with_directory_as_file(self, mock_resolve_config_file):
+        """Test for a clear error when --file points to a directory."""
+        with self.runner.isolated_filesystem():
+            os.mkdir("task_dir")
+            result = self.runner.invoke(cli, ["run", "--file", "task_dir"])
+            self.assertNotEqual(result.exit_code, 0)
+            self.assertIn("Error: File not found: task_dir", result.output)
+
+    @patch("trae_agent.cli._run.resolve_config_file", return_value="test_config.yaml")
     def test_run_with_both_task_and_file(self, mock_resolve_config_file):
         """Test for a clear error when both task string and --file are used."""
         result = self.runner.invoke(cli, ["run", "some task", "--file", "task.txt"])
@@ -106,11 +116,13 @@ class TestCli(unittest.TestCase):
         result = self.runner.invoke(cli, ["run"])
         self.assertIn("Error: Config file not found.", result.output)
 
-    @patch("trae_agent.cli.resolve_config_file", return_value="test_config.yaml")
-    @patch("trae_agent.cli.Agent")
-    @patch("trae_agent.cli.Config.create")
-    @patch("trae_agent.cli.ConsoleFactory.create_console")
-    @patch("trae_agent.cli.os.chdir", side_effect=FileNotFoundError("No such file or directory"))
+    @patch("trae_agent.cli._run.resolve_config_file", return_value="test_config.yaml")
+    @patch("trae_agent.cli._run.Agent")
+    @patch("trae_agent.cli._run.Config.create")
+    @patch("trae_agent.cli._run.ConsoleFactory.create_console")
+    @patch(
+        "trae_agent.cli._run.os.chdir", side_effect=FileNotFoundError("No such file or directory")
+    )
     def test_run_with_nonexistent_working_dir(
         self,
         mock_chdir,
@@ -137,11 +149,11 @@ class TestCli(unittest.TestCase):
         self.assertNotEqual(result.exit_code, 0)
         self.assertIn("Error changing directory", result.output)
 
-    @patch("trae_agent.cli.resolve_config_file", return_value="test_config.yaml")
-    @patch("trae_agent.cli.Agent")
-    @patch("trae_agent.cli.asyncio.run")
-    @patch("trae_agent.cli.Config.create")
-    @patch("trae_agent.cli.ConsoleFactory.create_console")
+    @patch("trae_agent.cli._run.resolve_config_file", return_value="test_config.yaml")
+    @patch("trae_agent.cli._run.Agent")
+    @patch("trae_agent.cli._run.asyncio.run")
+    @patch("trae_agent.cli._run.Config.create")
+    @patch("trae_agent.cli._run.ConsoleFactory.create_console")
     def test_run_with_string_that_is_also_a_filename(
         self,
         mock_create_console,
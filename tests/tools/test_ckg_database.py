@@ -0,0 +1,126 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from trae_agent.tools.ckg import ckg_database
+from trae_agent.tools.ckg.ckg_database import CKGDatabase
+
+
+class TestCKGDatabase(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.codebase_path = Path(temp_dir.name) / "codebase"
+        self.codebase_path.mkdir()
+        storage_path = Path(temp_dir.name) / "ckg"
+
+        for name, value in {
+            "CKG_DATABASE_PATH": storage_path,
+            "CKG_STORAGE_INFO_FILE": storage_path / "storage_info.json",
+        }.items():
+            patcher = patch.object(ckg_database, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # the temporary codebase is not a git repository; don't let an enclosing one be used
+        patcher = patch.object(ckg_database, "is_git_repository", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_file(self, name: str, content: str, mtime_ns: int):
+        file = self.codebase_path / name
+        file.write_text(content)
+        os.utime(file, ns=(mtime_ns, mtime_ns))
+
+    def test_query_function_and_class(self):
+        self.write_file("a.py", "class A:\n    def method(self):\n        pass\n", 1_000)
+
+        database = CKGDatabase(self.codebase_path)
+
+        self.assertEqual([entry.name for entry in database.query_class("A")], ["A"])
+        methods = database.query_function("method", entry_type="class_method")
+        self.assertEqual([entry.parent_class for entry in methods], ["A"])
+
+    def test_mapped_files_are_parsed(self):
+        self.write_file("a.py", "class A:\n    def method(self):\n        pass\n", 1_000)
+
+        with patch.object(ckg_database, "CKG_MMAP_MIN_FILE_SIZE", 1):
+            database = CKGDatabase(self.codebase_path)
+
+        self.assertEqual(
+            [entry.body for entry in database.query_class("A")],
+            ["class A:\n    def method(self):\n        pass"],
+        )
+
+    def test_ignored_files_are_not_indexed(self):
+        for directory in (".hidden", "node_modules", "src"):
+            (self.codebase_path / directory).mkdir()
+        self.write_file(".hidden/a.py", "def hidden_function():\n    pass\n", 1_000)
+        self.write_file("node_modules/b.js", "class Dependency {}\n", 1_000)
+        self.write_file("src/c.py", "def source_function():\n    pass\n", 1_000)
+
+        with patch.object(ckg_database, "CKG_MAX_FILE_SIZE", 100):
+            self.write_file("src/d.py", "def generated_function():\n    pass\n" * 10, 1_000)
+            database = CKGDatabase(self.codebase_path)
+
+        self.assertEqual(len(database.query_function("source_function")), 1)
+        self.assertEqual(database.query_function("hidden_function"), [])
+        self.assertEqual(database.query_class("Dependency"), [])
+        self.assertEqual(database.query_function("generated_function"), [])
+
+    def test_query_truncates_bodies(self):
+        self.write_file("a.py", "class A:\n    def method(self):\n        pass\n", 1_000)
+
+        database = CKGDatabase(self.codebase_path)
+
+        self.assertEqual(database.query_class("A", max_body_length=7)[0].body, "class A")
+        methods = database.query_function("method", "class_method", max_body_length=0)
+        self.assertEqual([entry.body for entry in methods], [""])
+        self.assertEqual(database.query_function("method", "function"), [])
+
+    def test_changed_codebase_only_reparses_modified_files(self):
+        self.write_file("a.py", "def old_function():\n    pass\n", 1_000)
+        self.write_file("b.py", "def unchanged_function():\n    pass\n", 1_000)
+        self.write_file("c.py", "def deleted_function():\n    pass\n", 1_000)
+        _ = CKGDatabase(self.codebase_path)
+
+        self.write_file("a.py", "def new_function():\n    pass\n", 2_000)
+        (self.codebase_path / "c.py").unlink()
+        self.write_file("d.py", "def added_function():\n    pass\n", 2_000)
+
+        with patch.object(ckg_database, "_parse_file", wraps=ckg_database._parse_file) as parse:
+            database = CKGDatabase(self.codebase_path)
+
+        parsed_files = sorted(Path(call.args[0]).name for call in parse.call_args_list)
+        self.assertEqual(parsed_files, ["a.py", "d.py"])
+        for name, expected_count in {
+            "old_function": 0,
+            "new_function": 1,
+            "unchanged_function": 1,
+            "deleted_function": 0,
+            "added_function": 1,
+        }.items():
+            self.assertEqual(len(database.query_function(name)), expected_count, name)
+
+    def test_failed_update_is_redone_on_next_run(self):
+        self.write_file("a.py", "def old_function():\n    pass\n", 1_000)
+        _ = CKGDatabase(self.codebase_path)
+
+        self.write_file("a.py", "def new_function():\n    pass\n", 2_000)
+        with (
+            patch.object(ckg_database, "_parse_file", side_effect=OSError("unreadable")),
+            self.assertRaises(OSError),
+        ):
+            _ = CKGDatabase(self.codebase_path)
+
+        database = CKGDatabase(self.codebase_path)
+        self.assertEqual(database.query_function("old_function"), [])
+        self.assertEqual(len(database.query_function("new_function")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
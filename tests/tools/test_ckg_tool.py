@@ -0,0 +1,117 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import tempfile
+import threading
+import unittest
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from trae_agent.tools import ckg_tool
+from trae_agent.tools.base import ToolCallArguments
+from trae_agent.tools.ckg import ckg_database
+from trae_agent.tools.ckg_tool import CKGTool
+
+
+class TestCKGTool(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.codebase_path = Path(temp_dir.name) / "codebase"
+        self.codebase_path.mkdir()
+        storage_path = Path(temp_dir.name) / "ckg"
+
+        for name, value in {
+            "CKG_DATABASE_PATH": storage_path,
+            "CKG_STORAGE_INFO_FILE": storage_path / "storage_info.json",
+            "CKG_PARALLEL_MIN_FILES": 4,
+        }.items():
+            patcher = patch.object(ckg_database, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # the temporary codebase is not a git repository; don't let an enclosing one be used
+        patcher = patch.object(ckg_database, "is_git_repository", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.tool = CKGTool()
+
+    async def test_parallel_build_does_not_fork(self):
+        for index in range(8):
+            (self.codebase_path / f"module_{index}.py").write_text(
+                f"def function_{index}():\n    pass\n"
+            )
+
+        with (
+            patch.object(ckg_database.os, "cpu_count", return_value=4),
+            patch.object(
+                ckg_database, "ProcessPoolExecutor", wraps=ProcessPoolExecutor
+            ) as executor,
+            warnings.catch_warnings(record=True) as caught,
+        ):
+            warnings.simplefilter("always")
+            result = await self.tool.execute(
+                ToolCallArguments(
+                    {
+                        "command": "search_function",
+                        "path": str(self.codebase_path),
+                        "identifier": "function_7",
+                    }
+                )
+            )
+
+        self.assertIsNone(result.error)
+        self.assertIn("Found 1 functions named function_7", result.output or "")
+        executor.assert_called_once()
+        self.assertNotEqual(executor.call_args.kwargs["mp_context"].get_start_method(), "fork")
+        self.assertFalse([w for w in caught if "fork()" in str(w.message)])
+
+    def search_arguments(self, path: Path) -> ToolCallArguments:
+        return ToolCallArguments(
+            {"command": "search_function", "path": str(path), "identifier": "function"}
+        )
+
+    async def test_slow_build_does_not_block_other_codebases(self):
+        slow_path, built_path, other_path = (self.codebase_path / name for name in "abc")
+        for path in (slow_path, built_path, other_path):
+            path.mkdir()
+        slow_build_started, slow_build_released = threading.Event(), threading.Event()
+
+        def build_database(codebase_path: Path):
+            if codebase_path == slow_path:
+                slow_build_started.set()
+                _ = slow_build_released.wait(10)
+            database = MagicMock()
+            database.query_function.return_value = []
+            return database
+
+        with patch.object(ckg_tool, "CKGDatabase", side_effect=build_database) as database_class:
+            _ = await self.tool.execute(self.search_arguments(built_path))
+            slow_searches = [
+                asyncio.create_task(self.tool.execute(self.search_arguments(slow_path)))
+                for _ in range(2)
+            ]
+            while not slow_build_started.is_set():
+                await asyncio.sleep(0.01)
+
+            try:
+                # a cached codebase and an unrelated build don't wait for the slow build
+                for path in (built_path, other_path):
+                    result = await asyncio.wait_for(
+                        self.tool.execute(self.search_arguments(path)), timeout=5
+                    )
+                    self.assertIn("No functions named function found", result.output or "")
+            finally:
+                slow_build_released.set()
+            _ = await asyncio.gather(*slow_searches)
+
+        # the two parallel searches of the slow codebase share a single build
+        built_paths = [call.args[0] for call in database_class.call_args_list]
+        self.assertEqual(sorted(built_paths), [slow_path, built_path, other_path])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,14 @@
 # Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import re
+import tempfile
 import unittest
 from pathlib import Path
+from types import ModuleType
 from unittest.mock import AsyncMock, patch
 
+from trae_agent.tools import edit_tool, edit_tool_cli
 from trae_agent.tools.base import ToolCallArguments
 from trae_agent.tools.edit_tool import TextEditorTool
 
@@ -127,5 +131,147 @@ class TestTextEditorTool(unittest.IsolatedAsyncioTestCase):
         self.assertIn("No path provided", result.error)
 
 
+class TextEditorLineRangeTests:
+    """Line range tests run against both the tool and its standalone CLI copy."""
+
+    module: ModuleType
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.test_file = Path(temp_dir.name) / "test_file.txt"
+        self.tool = self.module.TextEditorTool()
+        self.ten_lines = "\n".join(f"line{i}" for i in range(1, 11))
+
+    def numbered_lines(self, output: str) -> list[tuple[int, str]]:
+        """Parse the `cat -n` style lines of a tool output."""
+        return [
+            (int(number), line) for number, line in re.findall(r"^ *(\d+)\t(.*)$", output, re.M)
+        ]
+
+    async def view(self, content: str, view_range: list[int]) -> list[tuple[int, str]]:
+        _ = self.test_file.write_text(content)
+        result = await self.tool._view(self.test_file, view_range)
+        return self.numbered_lines(result.output)
+
+    async def test_view_range_near_top(self):
+        lines = await self.view(self.ten_lines, [2, 3])
+        self.assertEqual(lines, [(2, "line2"), (3, "line3")])
+
+    async def test_view_range_near_bottom(self):
+        lines = await self.view(self.ten_lines, [8, 9])
+        self.assertEqual(lines, [(8, "line8"), (9, "line9")])
+
+    async def test_view_range_to_end_of_file(self):
+        lines = await self.view(self.ten_lines, [8, -1])
+        self.assertEqual(lines, [(8, "line8"), (9, "line9"), (10, "line10")])
+
+    async def test_view_range_of_single_line_file(self):
+        self.assertEqual(await self.view("only", [1, 1]), [(1, "only")])
+        self.assertEqual(await self.view("only", [1, -1]), [(1, "only")])
+
+    async def test_invalid_view_ranges(self):
+        _ = self.test_file.write_text(self.ten_lines)
+        for view_range, message in [
+            ([1, 2, 3], "should be a list of two integers"),
+            ([0, 2], "Its first element `0`"),
+            ([11, 11], "Its first element `11`"),
+            ([1, 11], "Its second element `11` should be smaller"),
+            ([5, 3], "Its second element `3` should be larger or equal"),
+        ]:
+            with (
+                self.subTest(view_range=view_range),
+                self.assertRaisesRegex(self.module.ToolError, re.escape(message)),
+            ):
+                _ = await self.tool._view(self.test_file, view_range)
+
+    def insert(self, insert_line: int) -> list[tuple[int, str]]:
+        _ = self.test_file.write_text(self.ten_lines)
+        result = self.tool._insert(self.test_file, insert_line, "new")
+        return self.numbered_lines(result.output)
+
+    def assert_inserted(self, insert_line: int, snippet: list[tuple[int, str]]):
+        lines = self.ten_lines.split("\n")
+        new_lines = [*lines[:insert_line], "new", *lines[insert_line:]]
+        self.assertEqual(self.test_file.read_text(), "\n".join(new_lines))
+        # the snippet shows SNIPPET_LINES lines on either side of the inserted line
+        start = max(0, insert_line - self.module.SNIPPET_LINES)
+        end = min(insert_line + self.module.SNIPPET_LINES + 1, len(new_lines))
+        self.assertEqual(snippet, [(i + 1, new_lines[i]) for i in range(start, end)])
+
+    def test_insert_at_start(self):
+        snippet = self.insert(0)
+        self.assertEqual(snippet[0], (1, "new"))
+        self.assert_inserted(0, snippet)
+
+    def test_insert_in_top_half(self):
+        self.assert_inserted(3, self.insert(3))
+
+    def test_insert_in_bottom_half(self):
+        self.assert_inserted(8, self.insert(8))
+
+    def test_insert_at_end(self):
+        snippet = self.insert(10)
+        self.assertEqual(snippet[-1], (11, "new"))
+        self.assert_inserted(10, snippet)
+
+    def test_insert_out_of_range(self):
+        _ = self.test_file.write_text(self.ten_lines)
+        for insert_line in (-1, 11):
+            with (
+                self.subTest(insert_line=insert_line),
+                self.assertRaisesRegex(self.module.ToolError, "Invalid `insert_line`"),
+            ):
+                _ = self.tool._insert(self.test_file, insert_line, "new")
+        self.assertEqual(self.test_file.read_text(), self.ten_lines)
+
+    def str_replace(self, content: str, old_str: str, new_str: str) -> list[tuple[int, str]]:
+        _ = self.test_file.write_text(content)
+        result = self.tool.str_replace(self.test_file, old_str, new_str)
+        return self.numbered_lines(result.output)
+
+    def test_str_replace_near_end_of_file(self):
+        snippet = self.str_replace(self.ten_lines, "line9", "new9\nextra")
+
+        new_lines = [*(f"line{i}" for i in range(1, 9)), "new9", "extra", "line10"]
+        self.assertEqual(self.test_file.read_text(), "\n".join(new_lines))
+        # SNIPPET_LINES lines of context, cut off at the end of the file
+        start = 8 - self.module.SNIPPET_LINES
+        self.assertEqual(snippet, [(i + 1, new_lines[i]) for i in range(start, len(new_lines))])
+
+    def test_str_replace_last_line_of_short_file(self):
+        snippet = self.str_replace("one\ntwo\nthree", "three", "3")
+        self.assertEqual(self.test_file.read_text(), "one\ntwo\n3")
+        self.assertEqual(snippet, [(1, "one"), (2, "two"), (3, "3")])
+
+    def test_str_replace_empty_old_str_in_empty_file(self):
+        snippet = self.str_replace("", "", "first line")
+        self.assertEqual(self.test_file.read_text(), "first line")
+        self.assertEqual(snippet, [(1, "first line")])
+
+    def test_str_replace_empty_old_str_in_non_empty_file(self):
+        with self.assertRaisesRegex(self.module.ToolError, "Multiple occurrences"):
+            _ = self.str_replace("content", "", "new")
+        self.assertEqual(self.test_file.read_text(), "content")
+
+    def test_str_replace_overlapping_match_is_unique(self):
+        # like str.count, occurrences are counted without overlaps, so "aa" occurs once in "aaa"
+        _ = self.str_replace("aaa", "aa", "b")
+        self.assertEqual(self.test_file.read_text(), "ba")
+
+    def test_str_replace_separate_matches_are_not_unique(self):
+        with self.assertRaisesRegex(self.module.ToolError, "Multiple occurrences"):
+            _ = self.str_replace("aaaa", "aa", "b")
+        self.assertEqual(self.test_file.read_text(), "aaaa")
+
+
+class TestTextEditorToolLineRanges(TextEditorLineRangeTests, unittest.IsolatedAsyncioTestCase):
+    module = edit_tool
+
+
+class TestTextEditorToolCLILineRanges(TextEditorLineRangeTests, unittest.IsolatedAsyncioTestCase):
+    module = edit_tool_cli
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -29,10 +29,10 @@ class TestJSONEditTool(unittest.IsolatedAsyncioTestCase):
             json_data = self.sample_data
 
         read_content = json.dumps(json_data)
-        m_open = mock_open(read_data=read_content)
+        self.m_open = mock_open(read_data=read_content)
 
         # Patch open and path checks
-        self.open_patcher = patch("builtins.open", m_open)
+        self.open_patcher = patch("builtins.open", self.m_open)
         self.exists_patcher = patch("pathlib.Path.exists", return_value=True)
         self.is_absolute_patcher = patch("pathlib.Path.is_absolute", return_value=True)
 
@@ -44,8 +44,12 @@ class TestJSONEditTool(unittest.IsolatedAsyncioTestCase):
         self.addCleanup(self.exists_patcher.stop)
         self.addCleanup(self.is_absolute_patcher.stop)
 
-    @patch("json.dump")
-    async def test_set_config_value(self, mock_json_dump):
+    def written_data(self):
+        """Parse the JSON written to the mocked file."""
+        self.m_open().write.assert_called_once()
+        return json.loads(self.m_open().write.call_args[0][0])
+
+    async def test_set_config_value(self):
         """Test setting a simple configuration value."""
         self.mock_file_read()
         result = await self.tool.execute(
@@ -60,13 +64,11 @@ class TestJSONEditTool(unittest.IsolatedAsyncioTestCase):
         )
         self.assertEqual(result.error_code, 0)
 
-        # Verify that json.dump was called with the correct data
-        mock_json_dump.assert_called_once()
-        written_data = mock_json_dump.call_args[0][0]
+        # Verify that the correct data was written
+        written_data = self.written_data()
         self.assertFalse(written_data["config"]["enabled"])
 
-    @patch("json.dump")
-    async def test_update_user_name(self, mock_json_dump):
+    async def test_update_user_name(self):
         """Test updating a name in a list of objects."""
         self.mock_file_read()
         result = await self.tool.execute(
@@ -81,12 +83,10 @@ class TestJSONEditTool(unittest.IsolatedAsyncioTestCase):
         )
         self.assertEqual(result.error_code, 0)
 
-        mock_json_dump.assert_called_once()
-        written_data = mock_json_dump.call_args[0][0]
+        written_data = self.written_data()
         self.assertEqual(written_data["users"][0]["name"], "Alicia")
 
-    @patch("json.dump")
-    async def test_add_new_user(self, mock_json_dump):
+    async def test_add_new_user(self):
         """Test adding a new object to a list (by inserting at the end)."""
         self.mock_file_read()
         result = await self.tool.execute(
@@ -101,13 +101,11 @@ class TestJSONEditTool(unittest.IsolatedAsyncioTestCase):
         )
         self.assertEqual(result.error_code, 0)
 
-        mock_json_dump.assert_called_once()
-        written_data = mock_json_dump.call_args[0][0]
+        written_data = self.written_data()
         self.assertEqual(len(written_data["users"]), 3)
         self.assertEqual(written_data["users"][2]["name"], "Charlie")
 
-    @patch("json.dump")
-    async def test_add_new_config_key(self, mock_json_dump):
+    async def test_add_new_config_key(self):
         """Test adding a new key-value pair to an object."""
         self.mock_file_read()
         result = await self.tool.execute(
@@ -122,12 +120,10 @@ class TestJSONEditTool(unittest.IsolatedAsyncioTestCase):
         )
         self.assertEqual(result.error_code, 0)
 
-        mock_json_dump.assert_called_once()
-        written_data = mock_json_dump.call_args[0][0]
+        written_data = self.written_data()
         self.assertEqual(written_data["config"]["version"], "1.1.0")
 
-    @patch("json.dump")
-    async def test_remove_user_by_index(self, mock_json_dump):
+    async def test_remove_user_by_index(self):
         """Test removing an element from a list by its index."""
         self.mock_file_read()
         result = await self.tool.execute(
@@ -141,13 +137,11 @@ class TestJSONEditTool(unittest.IsolatedAsyncioTestCase):
         )
         self.assertEqual(result.error_code, 0)
 
-        mock_json_dump.assert_called_once()
-        written_data = mock_json_dump.call_args[0][0]
+        written_data = self.written_data()
         self.assertEqual(len(written_data["users"]), 1)
         self.assertEqual(written_data["users"][0]["name"], "Bob")
 
-    @patch("json.dump")
-    async def test_remove_config_key(self, mock_json_dump):
+    async def test_remove_config_key(self):
         """Test removing a key from an object."""
         self.mock_file_read()
         result = await self.tool.execute(
@@ -161,10 +155,61 @@ class TestJSONEditTool(unittest.IsolatedAsyncioTestCase):
         )
         self.assertEqual(result.error_code, 0)
 
-        mock_json_dump.assert_called_once()
-        written_data = mock_json_dump.call_args[0][0]
+        written_data = self.written_data()
         self.assertNotIn("enabled", written_data["config"])
 
+    async def test_remove_with_wildcard(self):
+        """Test removing a key from every element matched by a wildcard."""
+        self.mock_file_read()
+        result = await self.tool.execute(
+            ToolCallArguments(
+                {
+                    "operation": "remove",
+                    "file_path": self.test_file_path,
+                    "json_path": "$.users[*].name",
+                }
+            )
+        )
+        self.assertEqual(result.error_code, 0)
+        self.assertIn("removed 2 element(s)", result.output)
+
+        written_data = self.written_data()
+        self.assertEqual(written_data["users"], [{"id": 1}, {"id": 2}])
+        self.assertEqual(written_data["config"], {"enabled": True})
+
+    async def test_remove_all_list_elements(self):
+        """Test removing every element of a list; later indexes are removed first."""
+        self.mock_file_read()
+        result = await self.tool.execute(
+            ToolCallArguments(
+                {
+                    "operation": "remove",
+                    "file_path": self.test_file_path,
+                    "json_path": "$.users[*]",
+                }
+            )
+        )
+        self.assertEqual(result.error_code, 0)
+
+        written_data = self.written_data()
+        self.assertEqual(written_data["users"], [])
+
+    async def test_remove_root_is_rejected(self):
+        """Test that the root of the document cannot be removed."""
+        self.mock_file_read()
+        result = await self.tool.execute(
+            ToolCallArguments(
+                {
+                    "operation": "remove",
+                    "file_path": self.test_file_path,
+                    "json_path": "$",
+                }
+            )
+        )
+        self.assertEqual(result.error_code, -1)
+        self.assertIn("Cannot remove the root of the JSON document", result.error or "")
+        self.m_open().write.assert_not_called()
+
     async def test_view_operation(self):
         """Test the view operation to ensure it reads and returns content."""
         self.mock_file_read()
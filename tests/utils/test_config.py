@@ -1,7 +1,10 @@
 # Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import os
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 from trae_agent.utils.config import Config, ModelConfig, ModelProvider
@@ -232,5 +235,65 @@ class TestLakeviewConfig(unittest.TestCase):
         self.assertEqual(config.trae_agent.mcp_servers_config, {})
 
 
+class TestConfigFileCache(unittest.TestCase):
+    CONFIG_YAML = """
+agents:
+    trae_agent:
+        enable_lakeview: false
+        model: trae_agent_model
+        max_steps: {max_steps}
+model_providers:
+    anthropic:
+        api_key: test-api-key
+        provider: anthropic
+models:
+    trae_agent_model:
+        model_provider: anthropic
+        model: claude-model
+        temperature: 0.5
+        top_p: 1
+        top_k: 0
+        max_retries: 10
+        parallel_tool_calls: true
+"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_file = Path(self.temp_dir.name) / "trae_config.yaml"
+        _ = self.config_file.write_text(self.CONFIG_YAML.format(max_steps=50))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_cached_config_is_not_shared(self):
+        config = Config.create(config_file=str(self.config_file))
+        config.resolve_config_values(max_steps=7, api_key="override-key")
+
+        fresh_config = Config.create(config_file=str(self.config_file))
+        assert fresh_config.trae_agent is not None
+        self.assertEqual(fresh_config.trae_agent.max_steps, 50)
+        self.assertEqual(fresh_config.trae_agent.model.model_provider.api_key, "test-api-key")
+
+    def test_modified_config_file_is_reparsed(self):
+        _ = Config.create(config_file=str(self.config_file))
+        _ = self.config_file.write_text(self.CONFIG_YAML.format(max_steps=99))
+        stat = self.config_file.stat()
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        config = Config.create(config_file=str(self.config_file))
+        assert config.trae_agent is not None
+        self.assertEqual(config.trae_agent.max_steps, 99)
+
+    def test_config_file_rewritten_with_same_mtime_is_reparsed(self):
+        _ = Config.create(config_file=str(self.config_file))
+        stat = self.config_file.stat()
+        _ = self.config_file.write_text(self.CONFIG_YAML.format(max_steps=500))
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        config = Config.create(config_file=str(self.config_file))
+        assert config.trae_agent is not None
+        self.assertEqual(config.trae_agent.max_steps, 500)
+
+
 if __name__ == "__main__":
     unittest.main()
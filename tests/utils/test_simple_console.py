@@ -0,0 +1,47 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from trae_agent.utils.cli import simple_console
+
+
+@unittest.skipIf(importlib.util.find_spec("readline") is None, "readline is not available")
+class TestReadlineHistory(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(simple_console, "_readline_enabled", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.history_file = os.path.join(temp_dir.name, ".trae_history")
+        patcher = patch.object(simple_console, "HISTORY_FILE", self.history_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_history_is_set_up_once(self):
+        with patch.dict(os.environ, {"TRAE_NO_HISTORY": ""}), patch("atexit.register") as register:
+            self.assertTrue(simple_console._setup_readline_history())
+            self.assertTrue(simple_console._setup_readline_history())
+
+        register.assert_called_once_with(simple_console._write_history_file)
+
+    def test_history_can_be_disabled(self):
+        with patch.dict(os.environ, {"TRAE_NO_HISTORY": "1"}), patch("atexit.register") as register:
+            self.assertTrue(simple_console._setup_readline_history())
+
+        register.assert_not_called()
+
+    def test_unwritable_history_file_is_ignored(self):
+        with patch.object(
+            simple_console, "HISTORY_FILE", os.path.join(self.history_file, "missing", "history")
+        ):
+            simple_console._write_history_file()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,9 +5,29 @@
 
 __version__ = "0.1.0"
 
-from trae_agent.agent.base_agent import BaseAgent
-from trae_agent.agent.trae_agent import TraeAgent
-from trae_agent.tools.base import Tool, ToolExecutor
-from trae_agent.utils.llm_clients.llm_client import LLMClient
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from trae_agent.agent.base_agent import BaseAgent
+    from trae_agent.agent.trae_agent import TraeAgent
+    from trae_agent.tools.base import Tool, ToolExecutor
+    from trae_agent.utils.llm_clients.llm_client import LLMClient
 
 __all__ = ["BaseAgent", "TraeAgent", "LLMClient", "Tool", "ToolExecutor"]
+
+# Resolved on first attribute access so that importing a submodule (e.g. the CLI)
+# does not pull in every LLM client SDK.
+_lazy_imports = {
+    "BaseAgent": "trae_agent.agent.base_agent",
+    "TraeAgent": "trae_agent.agent.trae_agent",
+    "Tool": "trae_agent.tools.base",
+    "ToolExecutor": "trae_agent.tools.base",
+    "LLMClient": "trae_agent.utils.llm_clients.llm_client",
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy_imports:
+        return getattr(importlib.import_module(_lazy_imports[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
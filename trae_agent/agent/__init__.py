@@ -3,8 +3,26 @@
 
 """Agent module for Trae Agent."""
 
-from trae_agent.agent.agent import Agent
-from trae_agent.agent.base_agent import BaseAgent
-from trae_agent.agent.trae_agent import TraeAgent
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from trae_agent.agent.agent import Agent
+    from trae_agent.agent.base_agent import BaseAgent
+    from trae_agent.agent.trae_agent import TraeAgent
 
 __all__ = ["BaseAgent", "TraeAgent", "Agent"]
+
+# Resolved on first attribute access: trae_agent.utils.cli imports agent_basics from
+# this package, and agent.py imports trae_agent.utils.cli back.
+_lazy_imports = {
+    "Agent": "trae_agent.agent.agent",
+    "BaseAgent": "trae_agent.agent.base_agent",
+    "TraeAgent": "trae_agent.agent.trae_agent",
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy_imports:
+        return getattr(importlib.import_module(_lazy_imports[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -89,6 +89,14 @@ class Agent:
 
         try:
             execution = await self.agent.execute_task()
+        except BaseException:
+            # Don't leave the console task running on the loop (the interactive
+            # session keeps the same loop for the next task)
+            if cli_console_task:
+                _ = cli_console_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await cli_console_task
+            raise
         finally:
             # Ensure MCP cleanup happens even if execution fails
             with contextlib.suppress(Exception):
@@ -0,0 +1,64 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""Command Line Interface for Trae Agent."""
+
+import importlib
+from pathlib import Path
+
+import click
+
+
+def _load_dotenv() -> None:
+    """Load the nearest .env file from the current directory upwards, if there is one."""
+    cwd = Path.cwd()
+    for directory in (cwd, *cwd.parents):
+        dotenv_path = directory / ".env"
+        if dotenv_path.is_file():
+            # python-dotenv is only imported when there is something to load
+            from dotenv import load_dotenv
+
+            _ = load_dotenv(dotenv_path)
+            return
+
+
+class LazyGroup(click.Group):
+    """A click group whose subcommands are only imported when they are invoked.
+
+    Subcommands are registered as "module:attribute" import paths, so e.g.
+    `trae-cli run --help` never imports the interactive or tools commands.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: dict[str, str] = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr_name = self.lazy_subcommands[cmd_name].rsplit(":", 1)
+            return getattr(importlib.import_module(module_name), attr_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "run": "trae_agent.cli._run:run",
+        "interactive": "trae_agent.cli._interactive:interactive",
+        "show-config": "trae_agent.cli._show_config:show_config",
+        "tools": "trae_agent.cli._tools:tools",
+    },
+)
+@click.version_option(version="0.1.0")
+def cli():
+    """Trae Agent - LLM-based agent for software engineering tasks."""
+    # Load environment variables
+    _load_dotenv()
+
+
+def main():
+    """Main entry point for the CLI."""
+    cli()
@@ -0,0 +1,7 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+from trae_agent.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""Helpers shared by the CLI subcommands."""
+
+import sys
+from pathlib import Path
+
+from rich.console import Console
+
+console = Console()
+
+
+def event_loop_factory():
+    """Return uvloop's loop factory when uvloop is installed, otherwise None (asyncio default)."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def resolve_config_file(config_file: str) -> str:
+    """
+    Resolve config file with backward compatibility.
+    First tries the specified file, then falls back to JSON if YAML doesn't exist.
+    """
+    if config_file.endswith(".yaml") or config_file.endswith(".yml"):
+        yaml_path = Path(config_file)
+        json_path = Path(config_file.replace(".yaml", ".json").replace(".yml", ".json"))
+        if yaml_path.exists():
+            return str(yaml_path)
+        elif json_path.exists():
+            console.print(f"[yellow]YAML config not found, using JSON config: {json_path}[/yellow]")
+            return str(json_path)
+        else:
+            console.print(
+                "[red]Error: Config file not found. Please specify a valid config file in the command line option --config-file[/red]"
+            )
+            sys.exit(1)
+    else:
+        return config_file
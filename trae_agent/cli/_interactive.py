@@ -0,0 +1,229 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""The `interactive` command."""
+
+import asyncio
+import os
+import sys
+from collections.abc import Callable
+
+import click
+from rich.panel import Panel
+from rich.text import Text
+
+from trae_agent.agent import Agent
+from trae_agent.cli._common import console, event_loop_factory, resolve_config_file
+from trae_agent.utils.cli import CLIConsole, ConsoleFactory, ConsoleMode, ConsoleType
+from trae_agent.utils.config import Config, TraeAgentConfig
+
+
+@click.command()
+@click.option("--provider", "-p", help="LLM provider to use")
+@click.option("--model", "-m", help="Specific model to use")
+@click.option("--model-base-url", help="Base URL for the model API")
+@click.option("--api-key", "-k", help="API key (or set via environment variable)")
+@click.option(
+    "--config-file",
+    help="Path to configuration file",
+    default="trae_config.yaml",
+    envvar="TRAE_CONFIG_FILE",
+)
+@click.option("--max-steps", help="Maximum number of execution steps", type=int, default=20)
+@click.option("--trajectory-file", "-t", help="Path to save trajectory file")
+@click.option(
+    "--console-type",
+    "-ct",
+    type=click.Choice(["simple", "rich"], case_sensitive=False),
+    help="Type of console to use (simple or rich)",
+)
+@click.option(
+    "--agent-type",
+    "-at",
+    type=click.Choice(["trae_agent"], case_sensitive=False),
+    help="Type of agent to use (trae_agent)",
+    default="trae_agent",
+)
+def interactive(
+    provider: str | None = None,
+    model: str | None = None,
+    model_base_url: str | None = None,
+    api_key: str | None = None,
+    config_file: str = "trae_config.yaml",
+    max_steps: int | None = None,
+    trajectory_file: str | None = None,
+    console_type: str | None = "simple",
+    agent_type: str | None = "trae_agent",
+):
+    """
+    This function starts an interactive session with Trae Agent.
+    Args:
+        console_type: Type of console to use for the interactive session
+    """
+    # Apply backward compatibility for config file
+    config_file = resolve_config_file(config_file)
+
+    config = Config.create(
+        config_file=config_file,
+    ).resolve_config_values(
+        provider=provider,
+        model=model,
+        model_base_url=model_base_url,
+        api_key=api_key,
+        max_steps=max_steps,
+    )
+
+    if config.trae_agent:
+        trae_agent_config = config.trae_agent
+    else:
+        console.print("[red]Error: trae_agent configuration is required in the config file.[/red]")
+        sys.exit(1)
+
+    # Create CLI Console for interactive mode
+    console_mode = ConsoleMode.INTERACTIVE
+    if console_type:
+        selected_console_type = (
+            ConsoleType.SIMPLE if console_type.lower() == "simple" else ConsoleType.RICH
+        )
+    else:
+        selected_console_type = ConsoleFactory.get_recommended_console_type(console_mode)
+
+    cli_console = ConsoleFactory.create_console(
+        console_type=selected_console_type,
+        lakeview_config=config.lakeview,
+        mode=console_mode,
+    )
+
+    if not agent_type:
+        console.print("[red]Error: agent_type is required.[/red]")
+        sys.exit(1)
+
+    # Create agent
+    agent = Agent(agent_type, config, trajectory_file, cli_console)
+
+    # Get the actual trajectory file path (in case it was auto-generated)
+    trajectory_file = agent.trajectory_file
+
+    # For simple console, use traditional interactive loop
+    if selected_console_type == ConsoleType.SIMPLE:
+        asyncio.run(
+            _run_simple_interactive_loop(
+                agent, cli_console, trae_agent_config, config_file, trajectory_file
+            ),
+            loop_factory=event_loop_factory(),
+        )
+    else:
+        # For rich console, start the textual app which handles interaction
+        asyncio.run(
+            _run_rich_interactive_loop(
+                agent, cli_console, trae_agent_config, config_file, trajectory_file
+            ),
+            loop_factory=event_loop_factory(),
+        )
+
+
+def _show_help(agent: Agent, config_file: str):
+    console.print(
+        Panel(
+            """[bold]Available Commands:[/bold]
+
+• Type any task description to execute it
+• 'status' - Show agent status
+• 'clear' - Clear the screen
+• 'exit' or 'quit' - End the session""",
+            title="Help",
+            border_style="yellow",
+        )
+    )
+
+
+def _show_status(agent: Agent, config_file: str):
+    console.print(
+        Panel(
+            f"""[bold]Provider:[/bold] {agent.agent_config.model.model_provider.provider}
+    [bold]Model:[/bold] {agent.agent_config.model.model}
+    [bold]Available Tools:[/bold] {len(agent.agent.tools)}
+    [bold]Config File:[/bold] {config_file}
+    [bold]Working Directory:[/bold] {os.getcwd()}""",
+            title="Agent Status",
+            border_style="blue",
+        )
+    )
+
+
+def _clear_screen(agent: Agent, config_file: str):
+    console.clear()
+
+
+# Built-in interactive commands, keyed by their lower-cased name ('exit'/'quit' are
+# handled by the console's get_task_input)
+_INTERACTIVE_COMMANDS: dict[str, Callable[[Agent, str], None]] = {
+    "help": _show_help,
+    "status": _show_status,
+    "clear": _clear_screen,
+}
+
+
+async def _run_simple_interactive_loop(
+    agent: Agent,
+    cli_console: CLIConsole,
+    trae_agent_config: TraeAgentConfig,
+    config_file: str,
+    trajectory_file: str | None,
+):
+    """Run the interactive loop for simple console."""
+    while True:
+        try:
+            task = cli_console.get_task_input()
+            if task is None:
+                console.print("[green]Goodbye![/green]")
+                break
+
+            command = _INTERACTIVE_COMMANDS.get(task.lower())
+            if command is not None:
+                command(agent, config_file)
+                continue
+
+            working_dir = cli_console.get_working_dir_input()
+
+            # Set up trajectory recording for this task
+            console.print(f"[blue]Trajectory will be saved to: {trajectory_file}[/blue]")
+
+            task_args = {
+                "project_path": working_dir,
+                "issue": task,
+                "must_patch": "false",
+            }
+
+            # Execute the task
+            console.print(f"\n[blue]Executing task: {task}[/blue]")
+
+            # Execute the task; Agent.run starts the console and waits for its summary
+            _ = await agent.run(task, task_args)
+
+            console.print(f"\n[green]Trajectory saved to: {trajectory_file}[/green]")
+
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Use 'exit' or 'quit' to end the session[/yellow]")
+        except EOFError:
+            console.print("\n[green]Goodbye![/green]")
+            break
+        except Exception as e:
+            error_text = Text(f"Error: {e}", style="red")
+            console.print(error_text)
+
+
+async def _run_rich_interactive_loop(
+    agent: Agent,
+    cli_console: CLIConsole,
+    trae_agent_config: TraeAgentConfig,
+    config_file: str,
+    trajectory_file: str | None,
+):
+    """Run the interactive loop for rich console."""
+    # Set up the agent in the rich console so it can handle task execution
+    if hasattr(cli_console, "set_agent_context"):
+        cli_console.set_agent_context(agent, trae_agent_config, config_file, trajectory_file)
+
+    # Start the console UI - this will handle the entire interaction
+    await cli_console.start()
@@ -0,0 +1,126 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""The `show-config` command."""
+
+import sys
+from pathlib import Path
+
+import click
+from rich.panel import Panel
+from rich.table import Table
+
+from trae_agent.cli._common import console, resolve_config_file
+from trae_agent.utils.config import Config
+
+
+@click.command()
+@click.option(
+    "--config-file",
+    help="Path to configuration file",
+    default="trae_config.yaml",
+    envvar="TRAE_CONFIG_FILE",
+)
+@click.option("--provider", "-p", help="LLM provider to use")
+@click.option("--model", "-m", help="Specific model to use")
+@click.option("--model-base-url", help="Base URL for the model API")
+@click.option("--api-key", "-k", help="API key (or set via environment variable)")
+@click.option("--max-steps", help="Maximum number of execution steps", type=int)
+def show_config(
+    config_file: str,
+    provider: str | None,
+    model: str | None,
+    model_base_url: str | None,
+    api_key: str | None,
+    max_steps: int | None,
+):
+    """Show current configuration settings."""
+    # Apply backward compatibility for config file
+    config_file = resolve_config_file(config_file)
+
+    config_path = Path(config_file)
+    if not config_path.exists():
+        # Only legacy JSON configs fall back to built-in defaults; anything else has nothing to show
+        if not config_file.endswith(".json"):
+            console.print(
+                Panel(
+                    f"[yellow]No configuration file found at: {config_file}[/yellow]",
+                    title="Configuration Status",
+                    border_style="yellow",
+                )
+            )
+            return
+
+        console.print(
+            Panel(
+                f"""[yellow]No configuration file found at: {config_file}[/yellow]
+
+Using default settings and environment variables.""",
+                title="Configuration Status",
+                border_style="yellow",
+            )
+        )
+
+    config = Config.create(
+        config_file=config_file,
+    ).resolve_config_values(
+        provider=provider,
+        model=model,
+        model_base_url=model_base_url,
+        api_key=api_key,
+        max_steps=max_steps,
+    )
+
+    if config.trae_agent:
+        trae_agent_config = config.trae_agent
+    else:
+        console.print("[red]Error: trae_agent configuration is required in the config file.[/red]")
+        sys.exit(1)
+
+    model_config = trae_agent_config.model
+    provider_config = model_config.model_provider
+
+    # Display general settings
+    console.print(
+        _settings_table(
+            "General Settings",
+            [
+                ("Default Provider", str(provider_config.provider or "Not set")),
+                ("Max Steps", str(trae_agent_config.max_steps or "Not set")),
+            ],
+        )
+    )
+
+    # Display provider settings
+    provider_rows = [
+        ("Model", model_config.model or "Not set"),
+        ("Base URL", provider_config.base_url or "Not set"),
+        ("API Version", provider_config.api_version or "Not set"),
+        (
+            "API Key",
+            (
+                f"Set ({provider_config.api_key[:4]}...{provider_config.api_key[-4:]})"
+                if provider_config.api_key
+                else "Not set"
+            ),
+        ),
+        ("Max Tokens", str(model_config.max_tokens)),
+        ("Temperature", str(model_config.temperature)),
+        ("Top P", str(model_config.top_p)),
+    ]
+    if provider_config.provider == "anthropic":
+        provider_rows.append(("Top K", str(model_config.top_k)))
+
+    console.print(
+        _settings_table(f"{provider_config.provider.title()} Configuration", provider_rows)
+    )
+
+
+def _settings_table(title: str, rows: list[tuple[str, str]]) -> Table:
+    """Build a two-column Setting/Value table from pre-computed rows."""
+    table = Table(title=title)
+    table.add_column("Setting", style="cyan")
+    table.add_column("Value", style="green")
+    for setting, value in rows:
+        table.add_row(setting, value)
+    return table
@@ -0,0 +1,30 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""The `tools` command."""
+
+import click
+from rich.table import Table
+
+from trae_agent.cli._common import console
+from trae_agent.tools import tools_registry
+
+
+@click.command()
+def tools():
+    """Show available tools and their descriptions."""
+    rows: list[tuple[str, str]] = []
+    for tool_name, tool_class in tools_registry.items():
+        try:
+            tool = tool_class()
+            rows.append((tool.name, tool.description))
+        except Exception as e:
+            rows.append((tool_name, f"[red]Error loading: {e}[/red]"))
+
+    tools_table = Table(title="Available Tools")
+    tools_table.add_column("Tool Name", style="cyan")
+    tools_table.add_column("Description", style="green")
+    for row in rows:
+        tools_table.add_row(*row)
+
+    console.print(tools_table)
@@ -1,16 +1,22 @@
 # Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import functools
 import hashlib
 import json
+import mmap
+import multiprocessing
+import os
 import sqlite3
 import subprocess
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
-from tree_sitter import Node, Parser
-from tree_sitter_languages import get_parser
+from tree_sitter import Node, Parser, Query
+from tree_sitter_languages import get_language, get_parser
 
 from trae_agent.tools.ckg.base import ClassEntry, FunctionEntry, extension_to_language
 from trae_agent.utils.constants import LOCAL_STORAGE_PATH
@@ -18,13 +24,17 @@ from trae_agent.utils.constants import LOCAL_STORAGE_PATH
 CKG_DATABASE_PATH = LOCAL_STORAGE_PATH / "ckg"
 CKG_STORAGE_INFO_FILE = CKG_DATABASE_PATH / "storage_info.json"
 CKG_DATABASE_EXPIRY_TIME = 60 * 60 * 24 * 7  # 1 week in seconds
+CKG_PARALLEL_MIN_FILES = 200  # below this, worker process start-up outweighs parallel parsing
+CKG_MAX_FILE_SIZE = 2 * 1024 * 1024  # larger source files are almost always generated
+CKG_MMAP_MIN_FILE_SIZE = 16 * 1024  # smaller files are cheaper to read than to map
+# dependency and cache directories that are not part of the codebase itself
+CKG_IGNORED_DIRECTORIES = frozenset({"node_modules", "__pycache__", "venv"})
 
 
 """
 Known issues:
 1. When a subdirectory of a codebase that has already been indexed, the CKG is built again for this subdirectory.
-2. The rebuilding logic can be improved by only rebuilding for files that have been modified.
-3. For JavaScript and TypeScript, the AST is not complete: anonymous functions, arrow functions, etc., are not parsed.
+2. For JavaScript and TypeScript, the AST is not complete: anonymous functions, arrow functions, etc., are not parsed.
 """
 
 
@@ -80,16 +90,41 @@ def get_git_status_hash(folder_path: Path) -> str:
         return get_file_metadata_hash(folder_path)
 
 
+def _iter_source_files(folder_path: Path) -> Iterator[tuple[str, str, os.stat_result]]:
+    """Iterate over the path, language and stat of the files of a codebase indexed in the CKG.
+
+    Hidden, dependency and cache directories are pruned without being walked. Hidden files,
+    files in unknown languages and files larger than CKG_MAX_FILE_SIZE are skipped. Files are
+    yielded in a fixed order.
+    """
+    for root, dir_names, file_names in os.walk(folder_path.absolute()):
+        dir_names[:] = sorted(
+            dir_name
+            for dir_name in dir_names
+            if not dir_name.startswith(".") and dir_name not in CKG_IGNORED_DIRECTORIES
+        )
+        for file_name in sorted(file_names):
+            language = extension_to_language.get(os.path.splitext(file_name)[1])
+            if language is None or file_name.startswith("."):
+                continue
+            file_path = os.path.join(root, file_name)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            if stat.st_size <= CKG_MAX_FILE_SIZE:
+                yield file_path, language, stat
+
+
 def get_file_metadata_hash(folder_path: Path) -> str:
-    """Get hash based on file metadata (name, mtime, size) for non-git repositories."""
+    """Get hash based on file metadata (path, mtime, size) for non-git repositories.
+
+    Only the files indexed in the CKG are hashed, as no other file can change it.
+    """
     hash_md5 = hashlib.md5()
 
-    for file in folder_path.glob("**/*"):
-        if file.is_file() and not file.name.startswith("."):
-            stat = file.stat()
-            hash_md5.update(file.name.encode())
-            hash_md5.update(str(stat.st_mtime).encode())  # modification time
-            hash_md5.update(str(stat.st_size).encode())  # file size
+    for file_path, _, stat in _iter_source_files(folder_path):
+        hash_md5.update(f"{file_path}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode())
 
     return f"metadata-{hash_md5.hexdigest()}"
 
@@ -119,6 +154,17 @@ def clear_older_ckg():
                 print(f"error deleting older CKG database - {file.absolute().as_posix()}: {e}")
 
 
+# Tree-sitter queries capturing the function (@function) and class (@class) definitions
+# stored in the CKG for each language
+LANGUAGE_TO_QUERY = {
+    "python": "(function_definition) @function (class_definition) @class",
+    "java": "(method_declaration) @function (class_declaration) @class",
+    "cpp": "(function_definition) @function (class_specifier) @class",
+    "c": "(function_definition) @function",
+    "typescript": "(method_definition) @function (class_declaration) @class",
+    "javascript": "(method_definition) @function (class_declaration) @class",
+}
+
 SQL_LIST = {
     "functions": """
     CREATE TABLE IF NOT EXISTS functions (
@@ -142,9 +188,58 @@ SQL_LIST = {
         start_line INTEGER NOT NULL,
         end_line INTEGER NOT NULL
     )""",
+    "files": """
+    CREATE TABLE IF NOT EXISTS files (
+        file_path TEXT PRIMARY KEY,
+        signature TEXT NOT NULL
+    )""",
+    "functions_file_path_index": """
+    CREATE INDEX IF NOT EXISTS idx_functions_file_path ON functions (file_path)""",
+    "classes_file_path_index": """
+    CREATE INDEX IF NOT EXISTS idx_classes_file_path ON classes (file_path)""",
+    "functions_name_index": """
+    CREATE INDEX IF NOT EXISTS idx_functions_name ON functions (name)""",
+    "classes_name_index": """
+    CREATE INDEX IF NOT EXISTS idx_classes_name ON classes (name)""",
 }
 
 
+def _body_column(max_body_length: int | None) -> str:
+    """The column expression selecting an entry body, truncated to `max_body_length` characters."""
+    if max_body_length is None:
+        return "body"
+    return f"SUBSTR(body, 1, {int(max_body_length)})"
+
+
+@functools.cache
+def _get_parser(language: str) -> Parser:
+    return get_parser(language)
+
+
+@functools.cache
+def _get_query(language: str) -> Query:
+    return get_language(language).query(LANGUAGE_TO_QUERY[language])
+
+
+def _parse_file(file_path: str, language: str) -> list[FunctionEntry | ClassEntry]:
+    """Parse a source file and extract its CKG entries. Runs in a worker process for large codebases."""
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size < CKG_MMAP_MIN_FILE_SIZE:
+            return _extract_file_definitions(file.read(), language, file_path)
+        # the tree reads node texts from the map, so it stays open until the entries are built
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as source:
+            return _extract_file_definitions(source, language, file_path)
+
+
+def _extract_file_definitions(
+    source: bytes | mmap.mmap, language: str, file_path: str
+) -> list[FunctionEntry | ClassEntry]:
+    tree = _get_parser(language).parse(source)
+    return CKGDatabase._extract_definitions(
+        tree.root_node, language, _get_query(language), file_path
+    )
+
+
 class CKGDatabase:
     def __init__(self, codebase_path: Path):
         self._db_connection: sqlite3.Connection
@@ -170,31 +265,40 @@ class CKGDatabase:
             existing_codebase_snapshot_hash = ""
 
         current_codebase_snapshot_hash = get_folder_snapshot_hash(codebase_path)
-        if existing_codebase_snapshot_hash == current_codebase_snapshot_hash:
-            # we can reuse the existing database
-            database_path = get_ckg_database_path(existing_codebase_snapshot_hash)
-        else:
-            # we need to create a new database and delete the old one
-            database_path = get_ckg_database_path(existing_codebase_snapshot_hash)
-            if database_path.exists():
-                database_path.unlink()
-            database_path = get_ckg_database_path(current_codebase_snapshot_hash)
-
+        database_path = get_ckg_database_path(current_codebase_snapshot_hash)
+        database_is_outdated = existing_codebase_snapshot_hash != current_codebase_snapshot_hash
+        if database_is_outdated:
+            # the codebase has changed: move the old database to the new snapshot hash and
+            # update it below, so that only the modified files are parsed again
+            old_database_path = get_ckg_database_path(existing_codebase_snapshot_hash)
+            if old_database_path.exists():
+                if database_path.exists():
+                    old_database_path.unlink()
+                else:
+                    _ = old_database_path.rename(database_path)
+
+        database_exists = database_path.exists()
+        # the database may be built in a worker thread and queried from the event loop's thread
+        self._db_connection = sqlite3.connect(database_path, check_same_thread=False)
+        # create the tables (and any added since the database was built)
+        for sql in SQL_LIST.values():
+            self._db_connection.execute(sql)
+        self._db_connection.commit()
+        if not database_exists or database_is_outdated:
+            try:
+                self._construct_ckg()
+            except BaseException:
+                # drop the partial update now rather than when the connection is collected
+                self._db_connection.rollback()
+                raise
+
+        if database_is_outdated:
+            # only record the new snapshot once the database has been updated to it, so a build
+            # that fails partway is redone (from the file signatures) on the next run
             ckg_storage_info[codebase_path.absolute().as_posix()] = current_codebase_snapshot_hash
             with open(CKG_STORAGE_INFO_FILE, "w") as f:
                 json.dump(ckg_storage_info, f)
 
-        if database_path.exists():
-            # reuse existing database
-            self._db_connection = sqlite3.connect(database_path)
-        else:
-            # create new database with tables and build the CKG
-            self._db_connection = sqlite3.connect(database_path)
-            for sql in SQL_LIST.values():
-                self._db_connection.execute(sql)
-            self._db_connection.commit()
-            self._construct_ckg()
-
     def __del__(self):
         self._db_connection.close()
 
@@ -202,380 +306,349 @@ class CKGDatabase:
         """Update the CKG database."""
         self._construct_ckg()
 
-    def _recursive_visit_python(
-        self,
-        root_node: Node,
-        file_path: str,
-        parent_class: ClassEntry | None = None,
-        parent_function: FunctionEntry | None = None,
-    ):
-        """Recursively visit the Python AST and insert the entries into the database."""
-        if root_node.type == "function_definition":
-            function_name_node = root_node.child_by_field_name("name")
-            if function_name_node:
-                function_entry = FunctionEntry(
-                    name=function_name_node.text.decode(),
-                    file_path=file_path,
-                    body=root_node.text.decode(),
-                    start_line=root_node.start_point[0] + 1,
-                    end_line=root_node.end_point[0] + 1,
-                )
-                if parent_function and parent_class:
-                    # determine if the function is a method of the class or a function within a function
-                    if (
-                        parent_function.start_line >= parent_class.start_line
-                        and parent_function.end_line <= parent_class.end_line
-                    ):
-                        function_entry.parent_function = parent_function.name
-                    else:
-                        function_entry.parent_class = parent_class.name
-                elif parent_function:
-                    function_entry.parent_function = parent_function.name
-                elif parent_class:
-                    function_entry.parent_class = parent_class.name
-                self._insert_entry(function_entry)
-                parent_function = function_entry
-        elif root_node.type == "class_definition":
-            class_name_node = root_node.child_by_field_name("name")
-            if class_name_node:
-                class_body_node = root_node.child_by_field_name("body")
-                class_methods = ""
-                class_entry = ClassEntry(
-                    name=class_name_node.text.decode(),
-                    file_path=file_path,
-                    body=root_node.text.decode(),
-                    start_line=root_node.start_point[0] + 1,
-                    end_line=root_node.end_point[0] + 1,
-                )
-                if class_body_node:
-                    for child in class_body_node.children:
-                        function_definition_node = None
-                        if child.type == "decorated_definition":
-                            function_definition_node = child.child_by_field_name("definition")
-                        elif child.type == "function_definition":
-                            function_definition_node = child
-                        if function_definition_node:
-                            method_name_node = function_definition_node.child_by_field_name("name")
-                            if method_name_node:
-                                parameters_node = function_definition_node.child_by_field_name(
-                                    "parameters"
-                                )
-                                return_type_node = child.child_by_field_name("return_type")
-
-                                class_method_info = method_name_node.text.decode()
-                                if parameters_node:
-                                    class_method_info += f"{parameters_node.text.decode()}"
-                                if return_type_node:
-                                    class_method_info += f" -> {return_type_node.text.decode()}"
-                                class_methods += f"- {class_method_info}\n"
-                class_entry.methods = class_methods.strip() if class_methods != "" else None
-                parent_class = class_entry
-                self._insert_entry(class_entry)
-
-        if len(root_node.children) != 0:
-            for child in root_node.children:
-                self._recursive_visit_python(child, file_path, parent_class, parent_function)
-
-    def _recursive_visit_java(
-        self,
-        root_node: Node,
-        file_path: str,
-        parent_class: ClassEntry | None = None,
-        parent_function: FunctionEntry | None = None,
-    ):
-        """Recursively visit the Java AST and insert the entries into the database."""
-        if root_node.type == "class_declaration":
-            class_name_node = root_node.child_by_field_name("name")
-            if class_name_node:
-                class_entry = ClassEntry(
-                    name=class_name_node.text.decode(),
-                    file_path=file_path,
-                    body=root_node.text.decode(),
-                    start_line=root_node.start_point[0] + 1,
-                    end_line=root_node.end_point[0] + 1,
-                )
-                class_body_node = root_node.child_by_field_name("body")
-                class_methods = ""
-                class_fields = ""
-                if class_body_node:
-                    for child in class_body_node.children:
-                        if child.type == "field_declaration":
-                            class_fields += f"- {child.text.decode()}\n"
-                        if child.type == "method_declaration":
-                            method_builder = ""
-                            for method_property in child.children:
-                                if method_property.type == "block":
-                                    break
-                                method_builder += f"{method_property.text.decode()} "
-                            method_builder = method_builder.strip()
-                            class_methods += f"- {method_builder}\n"
-                class_entry.methods = class_methods.strip() if class_methods != "" else None
-                class_entry.fields = class_fields.strip() if class_fields != "" else None
-                parent_class = class_entry
-                self._insert_entry(class_entry)
-        elif root_node.type == "method_declaration":
-            method_name_node = root_node.child_by_field_name("name")
-            if method_name_node:
-                method_entry = FunctionEntry(
-                    name=method_name_node.text.decode(),
-                    file_path=file_path,
-                    body=root_node.text.decode(),
-                    start_line=root_node.start_point[0] + 1,
-                    end_line=root_node.end_point[0] + 1,
-                )
-                if parent_class:
-                    method_entry.parent_class = parent_class.name
-                self._insert_entry(method_entry)
-
-        if len(root_node.children) != 0:
-            for child in root_node.children:
-                self._recursive_visit_java(child, file_path, parent_class, parent_function)
-
-    def _recursive_visit_cpp(
-        self,
-        root_node: Node,
-        file_path: str,
-        parent_class: ClassEntry | None = None,
-        parent_function: FunctionEntry | None = None,
-    ):
-        """Recursively visit the C++ AST and insert the entries into the database."""
-        if root_node.type == "class_specifier":
-            class_name_node = root_node.child_by_field_name("name")
-            if class_name_node:
-                class_entry = ClassEntry(
-                    name=class_name_node.text.decode(),
-                    file_path=file_path,
-                    body=root_node.text.decode(),
-                    start_line=root_node.start_point[0] + 1,
-                    end_line=root_node.end_point[0] + 1,
-                )
-                class_body_node = root_node.child_by_field_name("body")
-                class_methods = ""
-                class_fields = ""
-                if class_body_node:
-                    for child in class_body_node.children:
-                        if child.type == "function_definition":
-                            method_builder = ""
-                            for method_property in child.children:
-                                if method_property.type == "compound_statement":
-                                    break
-                                method_builder += f"{method_property.text.decode()} "
-                            method_builder = method_builder.strip()
-                            class_methods += f"- {method_builder}\n"
-                        if child.type == "field_declaration":
-                            child_is_property = True
-                            for child_property in child.children:
-                                if child_property.type == "function_declarator":
-                                    child_is_property = False
-                                    break
-                            if child_is_property:
-                                class_fields += f"- {child.text.decode()}\n"
-                            else:
-                                class_methods += f"- {child.text.decode()}\n"
-                class_entry.methods = class_methods.strip() if class_methods != "" else None
-                class_entry.fields = class_fields.strip() if class_fields != "" else None
-                parent_class = class_entry
-                self._insert_entry(class_entry)
-        elif root_node.type == "function_definition":
-            function_declarator_node = root_node.child_by_field_name("declarator")
-            if function_declarator_node:
-                function_name_node = function_declarator_node.child_by_field_name("declarator")
-                if function_name_node:
-                    function_entry = FunctionEntry(
-                        name=function_name_node.text.decode(),
-                        file_path=file_path,
-                        body=root_node.text.decode(),
-                        start_line=root_node.start_point[0] + 1,
-                        end_line=root_node.end_point[0] + 1,
-                    )
-                    if parent_class:
-                        function_entry.parent_class = parent_class.name
-                    self._insert_entry(function_entry)
+    @staticmethod
+    def _extract_definitions(
+        root_node: Node, language: str, query: Query, file_path: str
+    ) -> list[FunctionEntry | ClassEntry]:
+        """Extract the functions and classes captured by the language's query.
 
-        if len(root_node.children) != 0:
-            for child in root_node.children:
-                self._recursive_visit_cpp(child, file_path, parent_class, parent_function)
+        Captures are returned in document order, so the definitions enclosing a node have
+        always been seen before it; they are kept on a stack to find its parent class and
+        parent function.
+        """
+        entries: list[FunctionEntry | ClassEntry] = []
+        enclosing_entries: list[tuple[Node, FunctionEntry | ClassEntry]] = []
+        for node, capture_name in query.captures(root_node):
+            while enclosing_entries and enclosing_entries[-1][0].end_byte <= node.start_byte:
+                _ = enclosing_entries.pop()
+            parent_class = next(
+                (e for _, e in reversed(enclosing_entries) if isinstance(e, ClassEntry)), None
+            )
+            parent_function = next(
+                (e for _, e in reversed(enclosing_entries) if isinstance(e, FunctionEntry)), None
+            )
 
-    def _recursive_visit_c(
-        self,
-        root_node: Node,
-        file_path: str,
-        parent_class: ClassEntry | None = None,
-        parent_function: FunctionEntry | None = None,
-    ):
-        """Recursively visit the C AST and insert the entries into the database."""
-        if root_node.type == "function_definition":
-            function_declarator_node = root_node.child_by_field_name("declarator")
-            if function_declarator_node:
-                function_name_node = function_declarator_node.child_by_field_name("declarator")
-                if function_name_node:
-                    function_entry = FunctionEntry(
-                        name=function_name_node.text.decode(),
-                        file_path=file_path,
-                        body=root_node.text.decode(),
-                        start_line=root_node.start_point[0] + 1,
-                        end_line=root_node.end_point[0] + 1,
+            entry: FunctionEntry | ClassEntry | None = None
+            match language, capture_name:
+                case "python", "function":
+                    entry = CKGDatabase._python_function_entry(
+                        node, file_path, parent_class, parent_function
                     )
-                    self._insert_entry(function_entry)
-
-        if len(root_node.children) != 0:
-            for child in root_node.children:
-                self._recursive_visit_c(child, file_path, parent_class, parent_function)
-
-    def _recursive_visit_typescript(
-        self,
-        root_node: Node,
-        file_path: str,
-        parent_class: ClassEntry | None = None,
-        parent_function: FunctionEntry | None = None,
-    ):
-        if root_node.type == "class_declaration":
-            class_name_node = root_node.child_by_field_name("name")
-            if class_name_node:
-                class_entry = ClassEntry(
-                    name=class_name_node.text.decode(),
-                    file_path=file_path,
-                    body=root_node.text.decode(),
-                    start_line=root_node.start_point[0] + 1,
-                    end_line=root_node.end_point[0] + 1,
-                )
-                methods = ""
-                fields = ""
-                class_body_node = root_node.child_by_field_name("body")
-                if class_body_node:
-                    for child in class_body_node.children:
-                        if child.type == "method_definition":
-                            method_builder = ""
-                            for method_property in child.children:
-                                if method_property.type == "statement_block":
-                                    break
-                                method_builder += f"{method_property.text.decode()} "
-                            method_builder = method_builder.strip()
-                            methods += f"- {method_builder}\n"
-                        elif child.type == "public_field_definition":
-                            fields += f"- {child.text.decode()}\n"
-                class_entry.methods = methods.strip() if methods != "" else None
-                class_entry.fields = fields.strip() if fields != "" else None
-                parent_class = class_entry
-                self._insert_entry(class_entry)
-        elif root_node.type == "method_definition":
-            method_name_node = root_node.child_by_field_name("name")
-            if method_name_node:
-                method_entry = FunctionEntry(
-                    name=method_name_node.text.decode(),
-                    file_path=file_path,
-                    body=root_node.text.decode(),
-                    start_line=root_node.start_point[0] + 1,
-                    end_line=root_node.end_point[0] + 1,
-                )
-                if parent_class:
-                    method_entry.parent_class = parent_class.name
-                self._insert_entry(method_entry)
-
-        if len(root_node.children) != 0:
-            for child in root_node.children:
-                self._recursive_visit_typescript(child, file_path, parent_class, parent_function)
-
-    def _recursive_visit_javascript(
-        self,
-        root_node: Node,
+                case "python", "class":
+                    entry = CKGDatabase._python_class_entry(node, file_path)
+                case "java", "function":
+                    entry = CKGDatabase._java_method_entry(node, file_path, parent_class)
+                case "java", "class":
+                    entry = CKGDatabase._java_class_entry(node, file_path)
+                case "cpp", "function":
+                    entry = CKGDatabase._c_function_entry(node, file_path, parent_class)
+                case "cpp", "class":
+                    entry = CKGDatabase._cpp_class_entry(node, file_path)
+                case "c", "function":
+                    entry = CKGDatabase._c_function_entry(node, file_path)
+                case "typescript" | "javascript", "function":
+                    entry = CKGDatabase._javascript_method_entry(node, file_path, parent_class)
+                case "typescript" | "javascript", "class":
+                    entry = CKGDatabase._javascript_class_entry(node, file_path)
+                case _:
+                    pass
+
+            if entry is not None:
+                entries.append(entry)
+                enclosing_entries.append((node, entry))
+
+        return entries
+
+    @staticmethod
+    def _python_function_entry(
+        node: Node,
         file_path: str,
-        parent_class: ClassEntry | None = None,
-        parent_function: FunctionEntry | None = None,
-    ):
-        """Recursively visit the JavaScript AST and insert the entries into the database."""
-        if root_node.type == "class_declaration":
-            class_name_node = root_node.child_by_field_name("name")
-            if class_name_node:
-                class_entry = ClassEntry(
-                    name=class_name_node.text.decode(),
-                    file_path=file_path,
-                    body=root_node.text.decode(),
-                    start_line=root_node.start_point[0] + 1,
-                    end_line=root_node.end_point[0] + 1,
-                )
-                methods = ""
-                fields = ""
-                class_body_node = root_node.child_by_field_name("body")
-                if class_body_node:
-                    for child in class_body_node.children:
-                        if child.type == "method_definition":
-                            method_builder = ""
-                            for method_property in child.children:
-                                if method_property.type == "statement_block":
-                                    break
-                                method_builder += f"{method_property.text.decode()} "
-                            method_builder = method_builder.strip()
-                            methods += f"- {method_builder}\n"
-                        elif child.type == "public_field_definition":
-                            fields += f"- {child.text.decode()}\n"
-                class_entry.methods = methods.strip() if methods != "" else None
-                class_entry.fields = fields.strip() if fields != "" else None
-                parent_class = class_entry
-                self._insert_entry(class_entry)
-        elif root_node.type == "method_definition":
-            method_name_node = root_node.child_by_field_name("name")
-            if method_name_node:
-                method_entry = FunctionEntry(
-                    name=method_name_node.text.decode(),
-                    file_path=file_path,
-                    body=root_node.text.decode(),
-                    start_line=root_node.start_point[0] + 1,
-                    end_line=root_node.end_point[0] + 1,
-                )
-                if parent_class:
-                    method_entry.parent_class = parent_class.name
-                self._insert_entry(method_entry)
-
-        if len(root_node.children) != 0:
-            for child in root_node.children:
-                self._recursive_visit_javascript(child, file_path, parent_class, parent_function)
+        parent_class: ClassEntry | None,
+        parent_function: FunctionEntry | None,
+    ) -> FunctionEntry | None:
+        function_name_node = node.child_by_field_name("name")
+        if not function_name_node:
+            return None
+        function_entry = FunctionEntry(
+            name=function_name_node.text.decode(),
+            file_path=file_path,
+            body=node.text.decode(),
+            start_line=node.start_point[0] + 1,
+            end_line=node.end_point[0] + 1,
+        )
+        if parent_function and parent_class:
+            # determine if the function is a method of the class or a function within a function
+            if (
+                parent_function.start_line >= parent_class.start_line
+                and parent_function.end_line <= parent_class.end_line
+            ):
+                function_entry.parent_function = parent_function.name
+            else:
+                function_entry.parent_class = parent_class.name
+        elif parent_function:
+            function_entry.parent_function = parent_function.name
+        elif parent_class:
+            function_entry.parent_class = parent_class.name
+        return function_entry
+
+    @staticmethod
+    def _python_class_entry(node: Node, file_path: str) -> ClassEntry | None:
+        class_name_node = node.child_by_field_name("name")
+        if not class_name_node:
+            return None
+        class_body_node = node.child_by_field_name("body")
+        class_methods = ""
+        class_entry = ClassEntry(
+            name=class_name_node.text.decode(),
+            file_path=file_path,
+            body=node.text.decode(),
+            start_line=node.start_point[0] + 1,
+            end_line=node.end_point[0] + 1,
+        )
+        if class_body_node:
+            for child in class_body_node.children:
+                function_definition_node = None
+                if child.type == "decorated_definition":
+                    function_definition_node = child.child_by_field_name("definition")
+                elif child.type == "function_definition":
+                    function_definition_node = child
+                if function_definition_node:
+                    method_name_node = function_definition_node.child_by_field_name("name")
+                    if method_name_node:
+                        parameters_node = function_definition_node.child_by_field_name("parameters")
+                        return_type_node = child.child_by_field_name("return_type")
+
+                        class_method_info = method_name_node.text.decode()
+                        if parameters_node:
+                            class_method_info += f"{parameters_node.text.decode()}"
+                        if return_type_node:
+                            class_method_info += f" -> {return_type_node.text.decode()}"
+                        class_methods += f"- {class_method_info}\n"
+        class_entry.methods = class_methods.strip() if class_methods != "" else None
+        return class_entry
+
+    @staticmethod
+    def _java_class_entry(node: Node, file_path: str) -> ClassEntry | None:
+        class_name_node = node.child_by_field_name("name")
+        if not class_name_node:
+            return None
+        class_entry = ClassEntry(
+            name=class_name_node.text.decode(),
+            file_path=file_path,
+            body=node.text.decode(),
+            start_line=node.start_point[0] + 1,
+            end_line=node.end_point[0] + 1,
+        )
+        class_body_node = node.child_by_field_name("body")
+        class_methods = ""
+        class_fields = ""
+        if class_body_node:
+            for child in class_body_node.children:
+                if child.type == "field_declaration":
+                    class_fields += f"- {child.text.decode()}\n"
+                if child.type == "method_declaration":
+                    method_builder = ""
+                    for method_property in child.children:
+                        if method_property.type == "block":
+                            break
+                        method_builder += f"{method_property.text.decode()} "
+                    method_builder = method_builder.strip()
+                    class_methods += f"- {method_builder}\n"
+        class_entry.methods = class_methods.strip() if class_methods != "" else None
+        class_entry.fields = class_fields.strip() if class_fields != "" else None
+        return class_entry
+
+    @staticmethod
+    def _java_method_entry(
+        node: Node, file_path: str, parent_class: ClassEntry | None
+    ) -> FunctionEntry | None:
+        method_name_node = node.child_by_field_name("name")
+        if not method_name_node:
+            return None
+        method_entry = FunctionEntry(
+            name=method_name_node.text.decode(),
+            file_path=file_path,
+            body=node.text.decode(),
+            start_line=node.start_point[0] + 1,
+            end_line=node.end_point[0] + 1,
+        )
+        if parent_class:
+            method_entry.parent_class = parent_class.name
+        return method_entry
+
+    @staticmethod
+    def _cpp_class_entry(node: Node, file_path: str) -> ClassEntry | None:
+        class_name_node = node.child_by_field_name("name")
+        if not class_name_node:
+            return None
+        class_entry = ClassEntry(
+            name=class_name_node.text.decode(),
+            file_path=file_path,
+            body=node.text.decode(),
+            start_line=node.start_point[0] + 1,
+            end_line=node.end_point[0] + 1,
+        )
+        class_body_node = node.child_by_field_name("body")
+        class_methods = ""
+        class_fields = ""
+        if class_body_node:
+            for child in class_body_node.children:
+                if child.type == "function_definition":
+                    method_builder = ""
+                    for method_property in child.children:
+                        if method_property.type == "compound_statement":
+                            break
+                        method_builder += f"{method_property.text.decode()} "
+                    method_builder = method_builder.strip()
+                    class_methods += f"- {method_builder}\n"
+                if child.type == "field_declaration":
+                    child_is_property = True
+                    for child_property in child.children:
+                        if child_property.type == "function_declarator":
+                            child_is_property = False
+                            break
+                    if child_is_property:
+                        class_fields += f"- {child.text.decode()}\n"
+                    else:
+                        class_methods += f"- {child.text.decode()}\n"
+        class_entry.methods = class_methods.strip() if class_methods != "" else None
+        class_entry.fields = class_fields.strip() if class_fields != "" else None
+        return class_entry
+
+    @staticmethod
+    def _c_function_entry(
+        node: Node, file_path: str, parent_class: ClassEntry | None = None
+    ) -> FunctionEntry | None:
+        """Function entry for both C and C++ function definitions."""
+        function_declarator_node = node.child_by_field_name("declarator")
+        if not function_declarator_node:
+            return None
+        function_name_node = function_declarator_node.child_by_field_name("declarator")
+        if not function_name_node:
+            return None
+        function_entry = FunctionEntry(
+            name=function_name_node.text.decode(),
+            file_path=file_path,
+            body=node.text.decode(),
+            start_line=node.start_point[0] + 1,
+            end_line=node.end_point[0] + 1,
+        )
+        if parent_class:
+            function_entry.parent_class = parent_class.name
+        return function_entry
+
+    @staticmethod
+    def _javascript_class_entry(node: Node, file_path: str) -> ClassEntry | None:
+        """Class entry for both JavaScript and TypeScript class declarations."""
+        class_name_node = node.child_by_field_name("name")
+        if not class_name_node:
+            return None
+        class_entry = ClassEntry(
+            name=class_name_node.text.decode(),
+            file_path=file_path,
+            body=node.text.decode(),
+            start_line=node.start_point[0] + 1,
+            end_line=node.end_point[0] + 1,
+        )
+        methods = ""
+        fields = ""
+        class_body_node = node.child_by_field_name("body")
+        if class_body_node:
+            for child in class_body_node.children:
+                if child.type == "method_definition":
+                    method_builder = ""
+                    for method_property in child.children:
+                        if method_property.type == "statement_block":
+                            break
+                        method_builder += f"{method_property.text.decode()} "
+                    method_builder = method_builder.strip()
+                    methods += f"- {method_builder}\n"
+                elif child.type == "public_field_definition":
+                    fields += f"- {child.text.decode()}\n"
+        class_entry.methods = methods.strip() if methods != "" else None
+        class_entry.fields = fields.strip() if fields != "" else None
+        return class_entry
+
+    @staticmethod
+    def _javascript_method_entry(
+        node: Node, file_path: str, parent_class: ClassEntry | None
+    ) -> FunctionEntry | None:
+        """Function entry for both JavaScript and TypeScript method definitions."""
+        method_name_node = node.child_by_field_name("name")
+        if not method_name_node:
+            return None
+        method_entry = FunctionEntry(
+            name=method_name_node.text.decode(),
+            file_path=file_path,
+            body=node.text.decode(),
+            start_line=node.start_point[0] + 1,
+            end_line=node.end_point[0] + 1,
+        )
+        if parent_class:
+            method_entry.parent_class = parent_class.name
+        return method_entry
 
     def _construct_ckg(self) -> None:
-        """Initialise the code knowledge graph."""
+        """Build the code knowledge graph, parsing only the files that changed since the last build."""
+        indexed_files: dict[str, str] = dict(
+            self._db_connection.execute("SELECT file_path, signature FROM files").fetchall()
+        )
+        indexed_file_paths: set[str] = {
+            record[0]
+            for record in self._db_connection.execute(
+                "SELECT file_path FROM files UNION SELECT file_path FROM functions "
+                "UNION SELECT file_path FROM classes"
+            )
+        }
+
+        current_file_paths: set[str] = set()
+        file_paths: list[str] = []
+        languages: list[str] = []
+        signatures: list[str] = []
+        for file_path, language, stat in _iter_source_files(self._codebase_path):
+            current_file_paths.add(file_path)
+            signature = f"{stat.st_mtime_ns}-{stat.st_size}"
+            if indexed_files.get(file_path) == signature:
+                continue
+            file_paths.append(file_path)
+            languages.append(language)
+            signatures.append(signature)
+
+        # drop the entries of modified and deleted files
+        for file_path in (indexed_file_paths & set(file_paths)) | (
+            indexed_file_paths - current_file_paths
+        ):
+            self._delete_file_entries(file_path)
+
+        if len(file_paths) >= CKG_PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
+            # parsing is CPU bound, so large codebases are parsed in worker processes. The
+            # database is built from a worker thread while the event loop and console threads
+            # are running, and forking a multi-threaded process can deadlock the children.
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as executor:
+                for entries in executor.map(_parse_file, file_paths, languages, chunksize=16):
+                    for entry in entries:
+                        self._insert_entry(entry)
+        else:
+            for entries in map(_parse_file, file_paths, languages):
+                for entry in entries:
+                    self._insert_entry(entry)
 
-        # lazy load the parsers for the languages when needed
-        language_to_parser: dict[str, Parser] = {}
-        for file in self._codebase_path.glob("**/*"):
-            # skip hidden files and files in a hidden directory
-            if (
-                file.is_file()
-                and not file.name.startswith(".")
-                and "/." not in file.absolute().as_posix()
-            ):
-                extension = file.suffix
-                # ignore files with unknown extensions
-                if extension not in extension_to_language:
-                    continue
-                language = extension_to_language[extension]
-
-                language_parser = language_to_parser.get(language)
-                if not language_parser:
-                    language_parser = get_parser(language)
-                    language_to_parser[language] = language_parser
-
-                tree = language_parser.parse(file.read_bytes())
-                root_node = tree.root_node
-
-                match language:
-                    case "python":
-                        self._recursive_visit_python(root_node, file.absolute().as_posix())
-                    case "java":
-                        self._recursive_visit_java(root_node, file.absolute().as_posix())
-                    case "cpp":
-                        self._recursive_visit_cpp(root_node, file.absolute().as_posix())
-                    case "c":
-                        self._recursive_visit_c(root_node, file.absolute().as_posix())
-                    case "typescript":
-                        self._recursive_visit_typescript(root_node, file.absolute().as_posix())
-                    case "javascript":
-                        self._recursive_visit_javascript(root_node, file.absolute().as_posix())
-                    case _:
-                        continue
+        self._db_connection.executemany(
+            "INSERT OR REPLACE INTO files (file_path, signature) VALUES (?, ?)",
+            zip(file_paths, signatures, strict=True),
+        )
+
+        # commit all the entries at once rather than one transaction per entry
+        self._db_connection.commit()
+
+    def _delete_file_entries(self, file_path: str) -> None:
+        """Delete the functions, classes and signature recorded for a file."""
+        for table in ("functions", "classes", "files"):
+            self._db_connection.execute(f"DELETE FROM {table} WHERE file_path = ?", (file_path,))
 
     def _insert_entry(self, entry: FunctionEntry | ClassEntry) -> None:
         """
-        Insert entry into db.
+        Insert entry into db. The entry is committed by the caller.
 
         Args:
             entry: the entry to insert
@@ -591,8 +664,6 @@ class CKGDatabase:
             case ClassEntry():
                 self._insert_class(entry)
 
-        self._db_connection.commit()
-
     def _insert_function(self, entry: FunctionEntry) -> None:
         """
         Insert function entry including functions and class methodsinto db.
@@ -646,77 +717,66 @@ class CKGDatabase:
         )
 
     def query_function(
-        self, identifier: str, entry_type: Literal["function", "class_method"] = "function"
+        self,
+        identifier: str,
+        entry_type: Literal["function", "class_method"] = "function",
+        max_body_length: int | None = None,
     ) -> list[FunctionEntry]:
         """
         Search for a function in the database.
 
         Args:
             identifier: the identifier of the function to search for
+            entry_type: whether to search for functions or for class methods
+            max_body_length: if set, the bodies are truncated to this many characters in SQLite
 
         Returns:
             a list of function entries
         """
+        parent_class_condition = (
+            "parent_class IS NULL" if entry_type == "function" else "parent_class IS NOT NULL"
+        )
         records = self._db_connection.execute(
-            """SELECT name, file_path, body, start_line, end_line, parent_function, parent_class FROM functions WHERE name = ?""",
+            f"""SELECT name, file_path, {_body_column(max_body_length)}, start_line, end_line, parent_function, parent_class FROM functions WHERE name = ? AND {parent_class_condition}""",
             (identifier,),
         ).fetchall()
-        function_entries: list[FunctionEntry] = []
-        for record in records:
-            match entry_type:
-                case "function":
-                    if record[6] is None:
-                        function_entries.append(
-                            FunctionEntry(
-                                name=record[0],
-                                file_path=record[1],
-                                body=record[2],
-                                start_line=record[3],
-                                end_line=record[4],
-                                parent_function=record[5],
-                                parent_class=record[6],
-                            )
-                        )
-                case "class_method":
-                    if record[6] is not None:
-                        function_entries.append(
-                            FunctionEntry(
-                                name=record[0],
-                                file_path=record[1],
-                                body=record[2],
-                                start_line=record[3],
-                                end_line=record[4],
-                                parent_function=record[5],
-                                parent_class=record[6],
-                            )
-                        )
-        return function_entries
-
-    def query_class(self, identifier: str) -> list[ClassEntry]:
+        return [
+            FunctionEntry(
+                name=record[0],
+                file_path=record[1],
+                body=record[2],
+                start_line=record[3],
+                end_line=record[4],
+                parent_function=record[5],
+                parent_class=record[6],
+            )
+            for record in records
+        ]
+
+    def query_class(self, identifier: str, max_body_length: int | None = None) -> list[ClassEntry]:
         """
         Search for a class in the database.
 
         Args:
             identifier: the identifier of the class to search for
+            max_body_length: if set, the bodies are truncated to this many characters in SQLite
 
         Returns:
             a list of class entries
         """
         records = self._db_connection.execute(
-            """SELECT name, file_path, body, fields, methods, start_line, end_line FROM classes WHERE name = ?""",
+            f"""SELECT name, file_path, {_body_column(max_body_length)}, fields, methods, start_line, end_line FROM classes WHERE name = ?""",
             (identifier,),
         ).fetchall()
-        class_entries: list[ClassEntry] = []
-        for record in records:
-            class_entries.append(
-                ClassEntry(
-                    name=record[0],
-                    file_path=record[1],
-                    body=record[2],
-                    fields=record[3],
-                    methods=record[4],
-                    start_line=record[5],
-                    end_line=record[6],
-                )
+        return [
+            ClassEntry(
+                name=record[0],
+                file_path=record[1],
+                body=record[2],
+                fields=record[3],
+                methods=record[4],
+                start_line=record[5],
+                end_line=record[6],
             )
-        return class_entries
+            for record in records
+        ]
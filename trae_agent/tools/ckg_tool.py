@@ -1,6 +1,7 @@
 # Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
 from pathlib import Path
 from typing import override
 
@@ -11,6 +12,11 @@ from trae_agent.tools.run import MAX_RESPONSE_LEN
 CKGToolCommands = ["search_function", "search_class", "search_class_method"]
 
 
+def _max_body_length(print_body: bool) -> int:
+    # the output is clipped to MAX_RESPONSE_LEN, so longer bodies never need to leave SQLite
+    return MAX_RESPONSE_LEN if print_body else 0
+
+
 class CKGTool(Tool):
     """Tool to construct and query the code knowledge graph of a codebase."""
 
@@ -25,6 +31,9 @@ class CKGTool(Tool):
         #     }
         # }
         self._ckg_databases: dict[Path, CKGDatabase] = {}
+        # parallel tool calls on the same codebase wait for a single build of its CKG, while
+        # other codebases are built and queried independently
+        self._ckg_build_locks: dict[Path, asyncio.Lock] = {}
 
     @override
     def get_model_provider(self) -> str | None:
@@ -113,8 +122,12 @@ class CKGTool(Tool):
 
         ckg_database = self._ckg_databases.get(codebase_path)
         if ckg_database is None:
-            ckg_database = CKGDatabase(codebase_path)
-            self._ckg_databases[codebase_path] = ckg_database
+            async with self._ckg_build_locks.setdefault(codebase_path, asyncio.Lock()):
+                ckg_database = self._ckg_databases.get(codebase_path)
+                if ckg_database is None:
+                    # building the CKG parses the whole codebase, so keep it off the event loop
+                    ckg_database = await asyncio.to_thread(CKGDatabase, codebase_path)
+                    self._ckg_databases[codebase_path] = ckg_database
 
         match command:
             case "search_function":
@@ -137,7 +150,9 @@ class CKGTool(Tool):
     ) -> str:
         """Search for a function in the ckg database."""
 
-        entries = ckg_database.query_function(identifier, entry_type="function")
+        entries = ckg_database.query_function(
+            identifier, entry_type="function", max_body_length=_max_body_length(print_body)
+        )
 
         if len(entries) == 0:
             return f"No functions named {identifier} found."
@@ -166,7 +181,7 @@ class CKGTool(Tool):
     ) -> str:
         """Search for a class in the ckg database."""
 
-        entries = ckg_database.query_class(identifier)
+        entries = ckg_database.query_class(identifier, max_body_length=_max_body_length(print_body))
 
         if len(entries) == 0:
             return f"No classes named {identifier} found."
@@ -199,7 +214,9 @@ class CKGTool(Tool):
     ) -> str:
         """Search for a class method in the ckg database."""
 
-        entries = ckg_database.query_function(identifier, entry_type="class_method")
+        entries = ckg_database.query_function(
+            identifier, entry_type="class_method", max_body_length=_max_body_length(print_body)
+        )
 
         if len(entries) == 0:
             return f"No class methods named {identifier} found."
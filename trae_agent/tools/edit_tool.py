@@ -24,6 +24,21 @@ EditToolSubCommands = [
 SNIPPET_LINES: int = 4
 
 
+def _expand_tabs(text: str) -> str:
+    """Expand tabs; expandtabs copies the whole string even when it has no tabs."""
+    return text.expandtabs() if "\t" in text else text
+
+
+def _line_range(text: str, n_lines: int, start: int, end: int) -> list[str]:
+    """Get lines `start` to `end` (exclusive) of a text with `n_lines` lines.
+
+    Only the lines between the range and the nearer end of the text are split.
+    """
+    if end <= n_lines - start:
+        return text.split("\n", end)[start:end]
+    return text.rsplit("\n", n_lines - start)[1 : end - start + 1]
+
+
 class TextEditorTool(Tool):
     """Tool to replace a string in a file."""
 
@@ -159,7 +174,9 @@ Notes for using the `str_replace` command:
                     "The `view_range` parameter is not allowed when `path` points to a directory."
                 )
 
-            return_code, stdout, stderr = await run(rf"find {path} -maxdepth 2 -not -path '*/\.*'")
+            return_code, stdout, stderr = await run(
+                ["find", str(path), "-maxdepth", "2", "-not", "-path", r"*/\.*"]
+            )
             if not stderr:
                 stdout = f"Here's the files and directories up to 2 levels deep in {path}, excluding hidden items:\n{stdout}\n"
             return ToolExecResult(error_code=return_code, output=stdout, error=stderr)
@@ -167,10 +184,9 @@ Notes for using the `str_replace` command:
         file_content = self.read_file(path)
         init_line = 1
         if view_range:
-            if len(view_range) != 2 or not all(isinstance(i, int) for i in view_range):  # pyright: ignore[reportUnnecessaryIsInstance]
+            if len(view_range) != 2:
                 raise ToolError("Invalid `view_range`. It should be a list of two integers.")
-            file_lines = file_content.split("\n")
-            n_lines_file = len(file_lines)
+            n_lines_file = file_content.count("\n") + 1
             init_line, final_line = view_range
             if init_line < 1 or init_line > n_lines_file:
                 raise ToolError(
@@ -186,9 +202,10 @@ Notes for using the `str_replace` command:
                 )
 
             if final_line == -1:
-                file_content = "\n".join(file_lines[init_line - 1 :])
-            else:
-                file_content = "\n".join(file_lines[init_line - 1 : final_line])
+                final_line = n_lines_file
+            file_content = "\n".join(
+                _line_range(file_content, n_lines_file, init_line - 1, final_line)
+            )
 
         return ToolExecResult(
             output=self._make_output(file_content, str(path), init_line=init_line)
@@ -197,17 +214,18 @@ Notes for using the `str_replace` command:
     def str_replace(self, path: Path, old_str: str, new_str: str | None) -> ToolExecResult:
         """Implement the str_replace command, which replaces old_str with new_str in the file content"""
         # Read the file content
-        file_content = self.read_file(path).expandtabs()
-        old_str = old_str.expandtabs()
-        new_str = new_str.expandtabs() if new_str is not None else ""
-
-        # Check if old_str is unique in the file
-        occurrences = file_content.count(old_str)
-        if occurrences == 0:
+        file_content = _expand_tabs(self.read_file(path))
+        old_str = _expand_tabs(old_str)
+        new_str = _expand_tabs(new_str) if new_str is not None else ""
+
+        # Check if old_str is unique in the file, stopping the search at its second occurrence
+        # (an empty old_str can only be unique in an empty file)
+        first = file_content.find(old_str)
+        if first == -1:
             raise ToolError(
                 f"No replacement was performed, old_str `{old_str}` did not appear verbatim in {path}."
             )
-        elif occurrences > 1:
+        if file_content.find(old_str, first + max(len(old_str), 1)) != -1:
             file_content_lines = file_content.split("\n")
             lines = [idx + 1 for idx, line in enumerate(file_content_lines) if old_str in line]
             raise ToolError(
@@ -215,16 +233,21 @@ Notes for using the `str_replace` command:
             )
 
         # Replace old_str with new_str
-        new_file_content = file_content.replace(old_str, new_str)
+        new_file_content = file_content[:first] + new_str + file_content[first + len(old_str) :]
 
         # Write the new content to the file
         self.write_file(path, new_file_content)
 
         # Create a snippet of the edited section
-        replacement_line = file_content.split(old_str)[0].count("\n")
+        replacement_line = file_content.count("\n", 0, first)
         start_line = max(0, replacement_line - SNIPPET_LINES)
         end_line = replacement_line + SNIPPET_LINES + new_str.count("\n")
-        snippet = "\n".join(new_file_content.split("\n")[start_line : end_line + 1])
+        n_lines_new_file = new_file_content.count("\n") + 1
+        snippet = "\n".join(
+            _line_range(
+                new_file_content, n_lines_new_file, start_line, min(end_line + 1, n_lines_new_file)
+            )
+        )
 
         # Prepare the success message
         success_msg = f"The file {path} has been edited. "
@@ -237,28 +260,27 @@ Notes for using the `str_replace` command:
 
     def _insert(self, path: Path, insert_line: int, new_str: str) -> ToolExecResult:
         """Implement the insert command, which inserts new_str at the specified line in the file content."""
-        file_text = self.read_file(path).expandtabs()
-        new_str = new_str.expandtabs()
-        file_text_lines = file_text.split("\n")
-        n_lines_file = len(file_text_lines)
+        file_text = _expand_tabs(self.read_file(path))
+        new_str = _expand_tabs(new_str)
+        n_lines_file = file_text.count("\n") + 1
 
         if insert_line < 0 or insert_line > n_lines_file:
             raise ToolError(
                 f"Invalid `insert_line` parameter: {insert_line}. It should be within the range of lines of the file: {[0, n_lines_file]}"
             )
 
-        new_str_lines = new_str.split("\n")
-        new_file_text_lines = (
-            file_text_lines[:insert_line] + new_str_lines + file_text_lines[insert_line:]
-        )
-        snippet_lines = (
-            file_text_lines[max(0, insert_line - SNIPPET_LINES) : insert_line]
-            + new_str_lines
-            + file_text_lines[insert_line : insert_line + SNIPPET_LINES]
-        )
-
-        new_file_text = "\n".join(new_file_text_lines)
-        snippet = "\n".join(snippet_lines)
+        # Only split the lines between the insertion point and the nearer end of the file
+        if insert_line <= n_lines_file - insert_line:
+            *lines_before, text_after = file_text.split("\n", insert_line)
+            new_file_text = "\n".join([*lines_before, new_str, text_after])
+            snippet_lines_before = lines_before[max(0, insert_line - SNIPPET_LINES) :]
+            snippet_lines_after = text_after.split("\n", SNIPPET_LINES)[:SNIPPET_LINES]
+        else:
+            text_before, *lines_after = file_text.rsplit("\n", n_lines_file - insert_line)
+            new_file_text = "\n".join([text_before, new_str, *lines_after])
+            snippet_lines_before = text_before.rsplit("\n", SNIPPET_LINES)[-SNIPPET_LINES:]
+            snippet_lines_after = lines_after[:SNIPPET_LINES]
+        snippet = "\n".join([*snippet_lines_before, new_str, *snippet_lines_after])
 
         self.write_file(path, new_file_text)
 
@@ -299,7 +321,7 @@ Notes for using the `str_replace` command:
         """Generate output for the CLI based on the content of a file."""
         file_content = maybe_truncate(file_content)
         if expand_tabs:
-            file_content = file_content.expandtabs()
+            file_content = _expand_tabs(file_content)
         file_content = "\n".join(
             [f"{i + init_line:6}\t{line}" for i, line in enumerate(file_content.split("\n"))]
         )
@@ -311,12 +333,15 @@ Notes for using the `str_replace` command:
         view_range = arguments.get("view_range", None)
         if view_range is None:
             return await self._view(_path, None)
-        if not (isinstance(view_range, list) and all(isinstance(i, int) for i in view_range)):
+        # _view only checks the length of the range, the element types are checked here
+        view_range_int: list[int] = (
+            [i for i in view_range if isinstance(i, int)] if isinstance(view_range, list) else []
+        )
+        if not isinstance(view_range, list) or len(view_range_int) != len(view_range):
             return ToolExecResult(
                 error="Parameter `view_range` should be a list of integers.",
                 error_code=-1,
             )
-        view_range_int: list[int] = [i for i in view_range if isinstance(i, int)]
         return await self._view(_path, view_range_int)
 
     def _create_handler(self, arguments: ToolCallArguments, _path: Path) -> ToolExecResult:
@@ -3,6 +3,7 @@
 
 """JSON editing tool for structured JSON file modifications."""
 
+import functools
 import json
 from pathlib import Path
 from typing import override
@@ -14,6 +15,12 @@ from jsonpath_ng.exceptions import JSONPathError
 from trae_agent.tools.base import Tool, ToolCallArguments, ToolError, ToolExecResult, ToolParameter
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_jsonpath(json_path_str: str):
+    """Parse a JSONPath expression. Parsing takes milliseconds and agents reuse the same paths."""
+    return jsonpath_parse(json_path_str)
+
+
 class JSONEditTool(Tool):
     """Tool for editing JSON files using JSONPath expressions."""
 
@@ -175,18 +182,18 @@ JSONPath syntax supported:
     ) -> None:
         """Save JSON data to file."""
         try:
+            # json.dump always goes through the pure-Python encoder, while json.dumps uses the C
+            # one when not indenting; serializing first also leaves the file intact on errors
+            content = json.dumps(data, indent=2 if pretty_print else None, ensure_ascii=False)
             with open(file_path, "w", encoding="utf-8") as f:
-                if pretty_print:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(data, f, ensure_ascii=False)
+                _ = f.write(content)
         except Exception as e:
             raise ToolError(f"Error writing to file {file_path}: {str(e)}") from e
 
     def _parse_jsonpath(self, json_path_str: str):
         """Parse JSONPath expression with error handling."""
         try:
-            return jsonpath_parse(json_path_str)
+            return _compile_jsonpath(json_path_str)
         except JSONPathError as e:
             raise ToolError(f"Invalid JSONPath expression '{json_path_str}': {str(e)}") from e
         except Exception as e:
@@ -300,28 +307,26 @@ JSONPath syntax supported:
         match_count = len(matches)
 
         for match in reversed(matches):
-            parent_path = match.full_path.left
+            # Each match links to the object containing it, so the parent doesn't have to be
+            # looked up from the root again
+            if match.context is None:
+                raise ToolError("Cannot remove the root of the JSON document")
+            parent_obj = match.context.value
             target = match.path
 
-            parent_matches = parent_path.find(data)
-            if not parent_matches:
-                continue
-
-            for parent_match in parent_matches:
-                parent_obj = parent_match.value
-                try:
-                    if isinstance(target, Fields):
-                        key_to_remove = target.fields[0]
-                        if isinstance(parent_obj, dict) and key_to_remove in parent_obj:
-                            del parent_obj[key_to_remove]
-                    elif isinstance(target, Index):
-                        index_to_remove = target.index
-                        if isinstance(parent_obj, list) and -len(
-                            parent_obj
-                        ) <= index_to_remove < len(parent_obj):
-                            parent_obj.pop(index_to_remove)
-                except (KeyError, IndexError):
-                    pass
+            try:
+                if isinstance(target, Fields):
+                    key_to_remove = target.fields[0]
+                    if isinstance(parent_obj, dict) and key_to_remove in parent_obj:
+                        del parent_obj[key_to_remove]
+                elif isinstance(target, Index):
+                    index_to_remove = target.index
+                    if isinstance(parent_obj, list) and -len(parent_obj) <= index_to_remove < len(
+                        parent_obj
+                    ):
+                        parent_obj.pop(index_to_remove)
+            except (KeyError, IndexError):
+                pass
 
         await self._save_json_file(file_path, data, pretty_print)
         return ToolExecResult(
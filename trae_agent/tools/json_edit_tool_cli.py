@@ -90,11 +90,11 @@ class JSONEditTool(Tool):
         self, file_path: Path, data: dict | list, pretty_print: bool = True
     ) -> None:
         try:
+            # json.dump always goes through the pure-Python encoder, while json.dumps uses the C
+            # one when not indenting; serializing first also leaves the file intact on errors
+            content = json.dumps(data, indent=2 if pretty_print else None, ensure_ascii=False)
             with open(file_path, "w", encoding="utf-8") as f:
-                if pretty_print:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(data, f, ensure_ascii=False)
+                _ = f.write(content)
         except Exception as e:
             raise ToolError(f"Error writing to file {file_path}: {str(e)}") from e
 
@@ -13,6 +13,7 @@
 
 import asyncio
 import contextlib
+import shlex
 
 TRUNCATED_MESSAGE: str = "<response clipped><NOTE>To save on context only part of this file has been shown to you. You should retry this tool after you have searched inside the file with `grep -n` in order to find the line numbers of what you are looking for.</NOTE>"
 MAX_RESPONSE_LEN: int = 16000
@@ -27,24 +28,46 @@ def maybe_truncate(content: str, truncate_after: int | None = MAX_RESPONSE_LEN):
     )
 
 
+def _decode_output(output: bytes, truncate_after: int | None = MAX_RESPONSE_LEN) -> str:
+    """Decode command output, truncating it like `maybe_truncate`.
+
+    A UTF-8 character takes at most 4 bytes, so only the bytes that can end up in the truncated
+    result are decoded.
+    """
+    if truncate_after and len(output) > 4 * truncate_after:
+        head = output[: 4 * truncate_after].decode(errors="replace")
+        return head[:truncate_after] + TRUNCATED_MESSAGE
+    return maybe_truncate(output.decode(errors="replace"), truncate_after=truncate_after)
+
+
 async def run(
-    cmd: str,
+    cmd: str | list[str],
     timeout: float | None = 120.0,  # seconds
     truncate_after: int | None = MAX_RESPONSE_LEN,
 ):
-    """Run a shell command asynchronously with a timeout."""
-    process = await asyncio.create_subprocess_shell(
-        cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-    )
+    """Run a command asynchronously with a timeout.
+
+    A string is run by the shell; a list of arguments is executed directly, which saves starting
+    a shell when no shell features are needed.
+    """
+    if isinstance(cmd, str):
+        process = await asyncio.create_subprocess_shell(
+            cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+    else:
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
 
     try:
         stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
         return (
             process.returncode or 0,
-            maybe_truncate(stdout.decode(), truncate_after=truncate_after),
-            maybe_truncate(stderr.decode(), truncate_after=truncate_after),
+            _decode_output(stdout, truncate_after=truncate_after),
+            _decode_output(stderr, truncate_after=truncate_after),
         )
     except asyncio.TimeoutError as exc:
         with contextlib.suppress(ProcessLookupError):
             process.kill()
-        raise TimeoutError(f"Command '{cmd}' timed out after {timeout} seconds") from exc
+        command = cmd if isinstance(cmd, str) else shlex.join(cmd)
+        raise TimeoutError(f"Command '{command}' timed out after {timeout} seconds") from exc
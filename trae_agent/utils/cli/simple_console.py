@@ -4,6 +4,9 @@
 """Simple CLI Console implementation."""
 
 import asyncio
+import atexit
+import contextlib
+import os
 from typing import override
 
 from rich.console import Console
@@ -21,6 +24,43 @@ from trae_agent.utils.cli.cli_console import (
 )
 from trae_agent.utils.config import LakeviewConfig
 
+HISTORY_FILE = os.path.expanduser("~/.trae_history")
+HISTORY_LENGTH = 1000
+
+
+# Whether readline has been imported and configured for input(); set up once per process
+_readline_enabled: bool | None = None
+
+
+def _write_history_file() -> None:
+    import readline
+
+    # the home directory may be read-only or gone by the time the process exits
+    with contextlib.suppress(OSError):
+        readline.write_history_file(HISTORY_FILE)
+
+
+def _setup_readline_history() -> bool:
+    """Enable line editing for input() and, unless TRAE_NO_HISTORY is set, persistent history."""
+    global _readline_enabled
+    if _readline_enabled is not None:
+        return _readline_enabled
+
+    try:
+        import readline
+    except ImportError:  # e.g. Windows
+        _readline_enabled = False
+        return False
+
+    _readline_enabled = True
+    if os.environ.get("TRAE_NO_HISTORY"):
+        return True
+    with contextlib.suppress(OSError):
+        readline.read_history_file(HISTORY_FILE)
+    readline.set_history_length(HISTORY_LENGTH)
+    atexit.register(_write_history_file)
+    return True
+
 
 class SimpleCLIConsole(CLIConsole):
     """Simple text-based CLI console that prints agent execution trace."""
@@ -36,12 +76,19 @@ class SimpleCLIConsole(CLIConsole):
         """
         super().__init__(mode, lakeview_config)
         self.console: Console = Console()
+        self._execution_finished: asyncio.Event = asyncio.Event()
+        self._readline_enabled: bool = mode == ConsoleMode.INTERACTIVE and _setup_readline_history()
 
     @override
     def update_status(
         self, agent_step: AgentStep | None = None, agent_execution: AgentExecution | None = None
     ):
         """Update the console status with new agent step or execution info."""
+        if agent_execution is not None and agent_execution is not self.agent_execution:
+            # A new task started (interactive mode): step numbers restart from 1
+            self.console_step_history = {}
+            self._execution_finished.clear()
+
         if agent_step:
             if agent_step.step_number not in self.console_step_history:
                 # update step history
@@ -69,14 +116,16 @@ class SimpleCLIConsole(CLIConsole):
 
         self.agent_execution = agent_execution
 
+        if agent_execution and agent_execution.agent_state in [
+            AgentState.COMPLETED,
+            AgentState.ERROR,
+        ]:
+            self._execution_finished.set()
+
     @override
     async def start(self):
         """Start the console - wait for completion and then print summary."""
-        while self.agent_execution is None or (
-            self.agent_execution.agent_state != AgentState.COMPLETED
-            and self.agent_execution.agent_state != AgentState.ERROR
-        ):
-            await asyncio.sleep(1)
+        _ = await self._execution_finished.wait()
 
         # Print lakeview summary if enabled
         if self.lake_view and self.agent_execution:
@@ -192,9 +241,9 @@ class SimpleCLIConsole(CLIConsole):
         if self.mode != ConsoleMode.INTERACTIVE:
             return None
 
-        self.console.print("\n[bold blue]Task:[/bold blue] ", end="")
+        self.console.print()
         try:
-            task = input()
+            task = input(self._input_prompt("Task"))
             if task.lower() in ["exit", "quit"]:
                 return None
             return task
@@ -207,12 +256,20 @@ class SimpleCLIConsole(CLIConsole):
         if self.mode != ConsoleMode.INTERACTIVE:
             return ""
 
-        self.console.print("[bold blue]Working Directory:[/bold blue] ", end="")
         try:
-            return input()
+            return input(self._input_prompt("Working Directory"))
         except (EOFError, KeyboardInterrupt):
             return ""
 
+    def _input_prompt(self, label: str) -> str:
+        """Build a bold blue prompt for input(); passing it to input() lets readline redraw it."""
+        if self.console.color_system is None:
+            return f"{label}: "
+        if self._readline_enabled:
+            # \001/\002 mark the escape codes as zero-width for readline's cursor positioning
+            return f"\001\033[1;34m\002{label}:\001\033[0m\002 "
+        return f"\033[1;34m{label}:\033[0m "
+
     @override
     def stop(self):
         """Stop the console and cleanup resources."""
@@ -1,6 +1,8 @@
 # Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import copy
+import functools
 import os
 from dataclasses import dataclass, field
 
@@ -13,6 +15,21 @@ class ConfigError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=8)
+def _load_yaml_config_file(config_file: str, mtime_ns: int, size: int) -> dict:
+    """Parse a YAML config file. Cached by (absolute path, mtime, size) so unchanged files are
+    parsed once; the size catches edits within the filesystem's timestamp granularity."""
+    with open(config_file, "r") as f:
+        return yaml.safe_load(f)
+
+
+@functools.cache
+def _provider_env_vars(provider: str) -> tuple[str, str]:
+    """Return the (api key, base url) environment variable names for a model provider."""
+    prefix = provider.upper()
+    return prefix + "_API_KEY", prefix + "_BASE_URL"
+
+
 @dataclass
 class ModelProvider:
     """
@@ -94,8 +111,9 @@ class ModelConfig:
                 )
 
         # Map providers to their environment variable names
-        env_var_api_key = str(self.model_provider.provider).upper() + "_API_KEY"
-        env_var_api_base_url = str(self.model_provider.provider).upper() + "_BASE_URL"
+        env_var_api_key, env_var_api_base_url = _provider_env_vars(
+            str(self.model_provider.provider)
+        )
 
         resolved_api_key = resolve_config_value(
             cli_value=api_key,
@@ -217,8 +235,12 @@ class Config:
             if config_file is not None:
                 if config_file.endswith(".json"):
                     return cls.create_from_legacy_config(config_file=config_file)
-                with open(config_file, "r") as f:
-                    yaml_config = yaml.safe_load(f)
+                config_path = os.path.abspath(config_file)
+                # The cached dict is shared, so hand out a copy the caller is free to mutate
+                stat = os.stat(config_path)
+                yaml_config = copy.deepcopy(
+                    _load_yaml_config_file(config_path, stat.st_mtime_ns, stat.st_size)
+                )
             elif config_string is not None:
                 yaml_config = yaml.safe_load(config_string)
             else:
@@ -336,30 +358,27 @@ class Config:
         elif not legacy_config:
             raise ConfigError("No legacy_config or config_file provided")
 
+        default_provider = legacy_config.default_provider
+        legacy_model_provider = legacy_config.model_providers[default_provider]
+
         model_provider = ModelProvider(
-            api_key=legacy_config.model_providers[legacy_config.default_provider].api_key,
-            base_url=legacy_config.model_providers[legacy_config.default_provider].base_url,
-            api_version=legacy_config.model_providers[legacy_config.default_provider].api_version,
-            provider=legacy_config.default_provider,
+            api_key=legacy_model_provider.api_key,
+            base_url=legacy_model_provider.base_url,
+            api_version=legacy_model_provider.api_version,
+            provider=default_provider,
         )
 
         model_config = ModelConfig(
-            model=legacy_config.model_providers[legacy_config.default_provider].model,
+            model=legacy_model_provider.model,
             model_provider=model_provider,
-            max_tokens=legacy_config.model_providers[legacy_config.default_provider].max_tokens,
-            temperature=legacy_config.model_providers[legacy_config.default_provider].temperature,
-            top_p=legacy_config.model_providers[legacy_config.default_provider].top_p,
-            top_k=legacy_config.model_providers[legacy_config.default_provider].top_k,
-            parallel_tool_calls=legacy_config.model_providers[
-                legacy_config.default_provider
-            ].parallel_tool_calls,
-            max_retries=legacy_config.model_providers[legacy_config.default_provider].max_retries,
-            candidate_count=legacy_config.model_providers[
-                legacy_config.default_provider
-            ].candidate_count,
-            stop_sequences=legacy_config.model_providers[
-                legacy_config.default_provider
-            ].stop_sequences,
+            max_tokens=legacy_model_provider.max_tokens,
+            temperature=legacy_model_provider.temperature,
+            top_p=legacy_model_provider.top_p,
+            top_k=legacy_model_provider.top_k,
+            parallel_tool_calls=legacy_model_provider.parallel_tool_calls,
+            max_retries=legacy_model_provider.max_retries,
+            candidate_count=legacy_model_provider.candidate_count,
+            stop_sequences=legacy_model_provider.stop_sequences,
         )
         mcp_servers_config = {
             k: MCPServerConfig(**vars(v)) for k, v in legacy_config.mcp_servers.items()
@@ -383,7 +402,7 @@ class Config:
             trae_agent=trae_agent_config,
             lakeview=lakeview_config,
             model_providers={
-                legacy_config.default_provider: model_provider,
+                default_provider: model_provider,
             },
             models={
                 "default_model": model_config,
@@ -1,6 +1,7 @@
 # Copyright (c) 2025 ByteDance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import logging
 import random
 import time
 import traceback
@@ -9,6 +10,8 @@ from typing import Any, Callable, TypeVar
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
 
 def retry_with(
     func: Callable[..., T],
@@ -43,7 +46,7 @@ def retry_with(
 
                 sleep_time = random.randint(3, 30)
                 this_error_message = str(e)
-                print(
+                logger.warning(
                     f"{provider_name} API call failed: {this_error_message}. Will sleep for {sleep_time} seconds and will retry.\n{traceback.format_exc()}"
                 )
                 # Randomly sleep for 3-30 seconds
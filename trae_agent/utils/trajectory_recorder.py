@@ -9,6 +9,7 @@
 """Trajectory recording functionality for Trae Agent."""
 
 import json
+import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -16,6 +17,8 @@ from typing import Any
 from trae_agent.tools.base import ToolCall, ToolResult
 from trae_agent.utils.llm_clients.llm_basics import LLMMessage, LLMResponse
 
+logger = logging.getLogger(__name__)
+
 
 class TrajectoryRecorder:
     """Records trajectory data for agent execution and LLM interactions."""
@@ -34,7 +37,9 @@ class TrajectoryRecorder:
         try:
             self.trajectory_path.parent.mkdir(parents=True, exist_ok=True)
         except Exception:
-            print("Error creating trajectory directory. Trajectories may not be properly saved.")
+            logger.warning(
+                "Error creating trajectory directory. Trajectories may not be properly saved."
+            )
 
         self.trajectory_data: dict[str, Any] = {
             "task": "",
@@ -227,7 +232,7 @@ class TrajectoryRecorder:
                 json.dump(self.trajectory_data, f, indent=2, ensure_ascii=False)
 
         except Exception as e:
-            print(f"Warning: Failed to save trajectory to {self.trajectory_path}: {e}")
+            logger.warning(f"Warning: Failed to save trajectory to {self.trajectory_path}: {e}")
 
     def _serialize_message(self, message: LLMMessage) -> dict[str, Any]:
         """Serialize an LLM message to a dictionary."""